@@ -0,0 +1,535 @@
+"""
+프리미어리그 경기 중계(commentary) 역색인
+
+Commentary API 이벤트의 중계 문장 토큰과 이벤트 타입 / 팀 / 선수 / 시즌을
+하나의 역색인(term → 정렬된 문서 ID)으로 만들고, 세그먼트 단위로
+.npy 파일에 저장하여 메모리 매핑(mmap)으로 바로 조회합니다.
+
+새 경기는 새 세그먼트로 추가되며(증분 색인), compact()로 하나로 병합할 수 있습니다.
+
+    index.search(event_type='goal', player_id=204480, season=2025)
+    index.search(text='var')
+"""
+
+import argparse
+import json
+import re
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, TypedDict
+
+import numpy as np
+import requests
+
+from main import (
+    END_ROUND,
+    HEADERS,
+    PERIOD_FULL_TIME,
+    SEASON_ID,
+    START_ROUND,
+    console,
+    fetch_commentary_events,
+    fetch_matches_data,
+)
+
+# ==================== 타입 정의 ====================
+class CommentaryDoc(TypedDict):
+    """색인 문서(중계 이벤트 1건) 구조"""
+    doc_ID: int
+    match_ID: int
+    type: str
+    timestamp: str
+    team1: Optional[int]
+    team2: Optional[int]
+    player1: Optional[int]
+    player2: Optional[int]
+    comment: str
+
+
+class SegmentInfo(TypedDict):
+    """세그먼트 메타 정보"""
+    name: str
+    base_doc: int
+    num_docs: int
+
+
+# ==================== 상수 정의 ====================
+INDEX_DIR = Path('data/commentary_index')
+MANIFEST_NAME = 'index.json'
+
+# 필드 term 접두사 (본문 토큰과 같은 역색인에 저장)
+FIELD_TYPE = 'type:'
+FIELD_SEASON = 'season:'
+
+# 팀 / 선수 역할 컬럼 (역할별 term 접두사 = '{컬럼}:')
+# team1 / player1: 이벤트 주체 (득점자, 카드 받은 선수), team2 / player2: 상대 또는 보조 (어시스트, 블록)
+TEAM_ROLES = ('team1', 'team2')
+PLAYER_ROLES = ('player1', 'player2')
+ROLE_ANY = 'any'
+
+# 세그먼트 term 형식 버전 (형식이 바뀌면 색인을 다시 생성해야 함)
+INDEX_FORMAT = 3
+
+# 정수 컬럼의 누락값
+MISSING_ID = -1
+
+# 본문 토큰 패턴 (유니코드 단어, 소문자 변환)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Commentary API timestamp 형식 (UTC)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 세그먼트 파일 구성
+ID_COLUMNS = ['match_ID', 'team1', 'team2', 'player1', 'player2']
+
+
+# ==================== 토큰화 ====================
+def tokenize(text: str) -> list[str]:
+    """중계 문장을 소문자 단어 토큰으로 분리"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def role_term(role: str, value: str | int) -> str:
+    """역할별 팀 / 선수 term ('player1:204480')"""
+    return f"{role}:{int(value)}"
+
+
+def _role_terms(roles: tuple[str, ...], role: str, value: int) -> list[str]:
+    """검색 역할에 해당하는 term 목록 (ROLE_ANY면 모든 역할)"""
+    if role == ROLE_ANY:
+        return [role_term(name, value) for name in roles]
+    if role not in roles:
+        raise ValueError(f"역할은 {list(roles) + [ROLE_ANY]} 중 하나여야 합니다.")
+    return [role_term(role, value)]
+
+
+def parse_timestamp(value: str) -> int:
+    """UTC timestamp 문자열을 epoch 초로 변환 (호스트 시간대와 무관)"""
+    return int(datetime.strptime(value, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+
+
+def format_timestamp(epoch: int) -> str:
+    """epoch 초를 UTC timestamp 문자열로 변환"""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+def _to_id(value: Optional[str]) -> int:
+    """문자열 ID를 정수로 변환 (없으면 MISSING_ID)"""
+    return int(value) if value else MISSING_ID
+
+
+# ==================== 세그먼트 생성 ====================
+def build_postings(term_ids: np.ndarray, doc_ids: np.ndarray, num_terms: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (term, doc) 쌍을 CSR 형식 역색인으로 변환
+
+    Args:
+        term_ids: term ID 배열
+        doc_ids: 같은 길이의 문서 ID 배열
+        num_terms: 전체 term 수
+
+    Returns:
+        (offsets, postings) - term t의 문서 목록은 postings[offsets[t]:offsets[t + 1]]
+    """
+    # 중복 (term, doc) 제거 + term, doc 순 정렬
+    pairs = np.unique(term_ids.astype(np.int64) << 32 | doc_ids.astype(np.int64))
+    terms = (pairs >> 32).astype(np.int64)
+    postings = (pairs & 0xFFFFFFFF).astype(np.uint32)
+
+    offsets = np.zeros(num_terms + 1, dtype=np.int64)
+    np.cumsum(np.bincount(terms, minlength=num_terms), out=offsets[1:])
+    return offsets, postings
+
+
+def write_segment(segment_dir: Path, entries: list[tuple[int, Optional[int], dict]]) -> int:
+    """
+    중계 이벤트 목록으로 세그먼트 파일 생성
+
+    Args:
+        segment_dir: 세그먼트 디렉토리
+        entries: (경기 ID, 시즌, commentary 이벤트) 목록
+
+    Returns:
+        세그먼트 문서 수
+    """
+    segment_dir.mkdir(parents=True, exist_ok=True)
+    num_docs = len(entries)
+
+    vocab: dict[str, int] = {}
+    term_ids: list[int] = []
+    doc_ids: list[int] = []
+
+    columns = {name: np.full(num_docs, MISSING_ID, dtype=np.int64) for name in ID_COLUMNS}
+    timestamps = np.zeros(num_docs, dtype=np.int64)
+    types: list[str] = []
+    comments: list[bytes] = []
+
+    for doc_id, (match_id, season, event) in enumerate(entries):
+        event_type = event.get('type', '')
+        columns['match_ID'][doc_id] = int(match_id)
+        for name in ID_COLUMNS[1:]:
+            columns[name][doc_id] = _to_id(event.get(name))
+        timestamps[doc_id] = parse_timestamp(event['timestamp'])
+        types.append(event_type)
+        comments.append(event.get('comment', '').encode('utf-8'))
+
+        terms = set(tokenize(event.get('comment', '')))
+        terms.add(FIELD_TYPE + event_type)
+        for name in TEAM_ROLES + PLAYER_ROLES:
+            if event.get(name):
+                terms.add(role_term(name, event[name]))
+        if season is not None:
+            terms.add(FIELD_SEASON + str(season))
+
+        for term in terms:
+            term_ids.append(vocab.setdefault(term, len(vocab)))
+            doc_ids.append(doc_id)
+
+    offsets, postings = build_postings(np.array(term_ids), np.array(doc_ids), len(vocab))
+
+    # 중계 문장: UTF-8 바이트를 이어 붙인 blob + 오프셋
+    comment_offsets = np.zeros(num_docs + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in comments], out=comment_offsets[1:])
+    (segment_dir / 'comments.bin').write_bytes(b''.join(comments))
+    np.save(segment_dir / 'comment_offsets.npy', comment_offsets)
+
+    np.save(segment_dir / 'offsets.npy', offsets)
+    np.save(segment_dir / 'postings.npy', postings)
+    np.save(segment_dir / 'timestamps.npy', timestamps)
+    for name, values in columns.items():
+        np.save(segment_dir / f"{name}.npy", values)
+
+    (segment_dir / 'terms.json').write_text(json.dumps(list(vocab), ensure_ascii=False), encoding='utf-8')
+    (segment_dir / 'types.json').write_text(json.dumps(types, ensure_ascii=False), encoding='utf-8')
+
+    return num_docs
+
+
+# ==================== 세그먼트 조회 ====================
+class Segment:
+    """메모리 매핑된 세그먼트 하나"""
+
+    def __init__(self, segment_dir: Path, base_doc: int):
+        self.dir = segment_dir
+        self.base_doc = base_doc
+        terms = json.loads((segment_dir / 'terms.json').read_text(encoding='utf-8'))
+        self.vocab = {term: i for i, term in enumerate(terms)}
+        self.types = json.loads((segment_dir / 'types.json').read_text(encoding='utf-8'))
+
+        self.offsets = np.load(segment_dir / 'offsets.npy', mmap_mode='r')
+        self.postings = np.load(segment_dir / 'postings.npy', mmap_mode='r')
+        self.timestamps = np.load(segment_dir / 'timestamps.npy', mmap_mode='r')
+        self.comment_offsets = np.load(segment_dir / 'comment_offsets.npy', mmap_mode='r')
+        self.columns = {name: np.load(segment_dir / f"{name}.npy", mmap_mode='r') for name in ID_COLUMNS}
+        self.comments_path = segment_dir / 'comments.bin'
+        # 빈 파일은 memmap 불가
+        if self.comments_path.stat().st_size:
+            self.comments = np.memmap(self.comments_path, dtype=np.uint8, mode='r')
+        else:
+            self.comments = np.empty(0, dtype=np.uint8)
+
+    def comment(self, local: int) -> str:
+        """세그먼트 로컬 문서의 중계 문장"""
+        start, end = self.comment_offsets[local], self.comment_offsets[local + 1]
+        return self.comments[start:end].tobytes().decode('utf-8')
+
+    def lookup(self, term: str) -> np.ndarray:
+        """term의 세그먼트 로컬 문서 ID 목록"""
+        term_id = self.vocab.get(term)
+        if term_id is None:
+            return np.empty(0, dtype=np.uint32)
+        return self.postings[self.offsets[term_id]:self.offsets[term_id + 1]]
+
+    def lookup_any(self, terms: list[str]) -> np.ndarray:
+        """term 중 하나라도 포함하는 세그먼트 로컬 문서 ID 목록 (OR)"""
+        postings = self.lookup(terms[0])
+        for term in terms[1:]:
+            postings = np.union1d(postings, self.lookup(term))
+        return postings
+
+    def search(self, groups: list[list[str]]) -> np.ndarray:
+        """
+        모든 term 그룹을 만족하는 문서의 전역 문서 ID 목록
+
+        그룹 안의 term은 OR, 그룹끼리는 AND로 결합합니다.
+        """
+        # 가장 짧은 posting부터 교집합
+        lists = sorted((self.lookup_any(terms) for terms in groups), key=len)
+        result = np.asarray(lists[0])
+        for postings in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, postings, assume_unique=True)
+        return result.astype(np.int64) + self.base_doc
+
+    def pairs(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """세그먼트 역색인을 (term 목록, term ID, 문서 ID) 쌍으로 펼침"""
+        terms = list(self.vocab)
+        counts = np.diff(self.offsets)
+        term_ids = np.repeat(np.arange(len(terms)), counts)
+        return terms, term_ids, np.asarray(self.postings)
+
+
+# ==================== 색인 ====================
+class CommentaryIndex:
+    """세그먼트 목록으로 구성된 증분 commentary 역색인"""
+
+    def __init__(self, index_dir: Path = INDEX_DIR):
+        self.dir = index_dir
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = self._load_manifest()
+        self.segments = [
+            Segment(self.dir / info['name'], info['base_doc']) for info in self.manifest['segments']
+        ]
+
+    def _load_manifest(self) -> dict:
+        path = self.dir / MANIFEST_NAME
+        if not path.exists():
+            return {'format': INDEX_FORMAT, 'segments': [], 'matches': [], 'num_docs': 0, 'next_segment': 1}
+
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+        if manifest.get('format') != INDEX_FORMAT:
+            raise ValueError(f"색인 형식이 다릅니다. {self.dir}를 삭제하고 다시 색인하세요.")
+        return manifest
+
+    def _save_manifest(self) -> None:
+        path = self.dir / MANIFEST_NAME
+        tmp_path = path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(self.manifest, ensure_ascii=False), encoding='utf-8')
+        tmp_path.replace(path)
+
+    @property
+    def num_docs(self) -> int:
+        return self.manifest['num_docs']
+
+    def add_matches(self, matches: Iterable[tuple[int | str, Optional[int], list[dict]]]) -> int:
+        """
+        새 경기의 중계 이벤트를 새 세그먼트로 색인 (이미 색인된 경기는 건너뜀)
+
+        Args:
+            matches: (경기 ID, 시즌, commentary 이벤트 목록) 목록
+
+        Returns:
+            새로 색인된 문서 수
+        """
+        indexed = set(self.manifest['matches'])
+        entries: list[tuple[int, Optional[int], dict]] = []
+        new_matches: list[int] = []
+
+        for match_id, season, events in matches:
+            match_id = int(match_id)
+            if match_id in indexed:
+                continue
+            indexed.add(match_id)
+            new_matches.append(match_id)
+            entries.extend((match_id, season, event) for event in events)
+
+        if not entries:
+            return 0
+
+        name = f"seg_{self.manifest['next_segment']:06d}"
+        num_docs = write_segment(self.dir / name, entries)
+        segment_info: SegmentInfo = {'name': name, 'base_doc': self.num_docs, 'num_docs': num_docs}
+
+        self.manifest['segments'].append(segment_info)
+        self.manifest['matches'].extend(new_matches)
+        self.manifest['num_docs'] += num_docs
+        self.manifest['next_segment'] += 1
+        self._save_manifest()
+
+        self.segments.append(Segment(self.dir / name, segment_info['base_doc']))
+        return num_docs
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        event_type: Optional[str] = None,
+        team_id: Optional[int] = None,
+        player_id: Optional[int] = None,
+        season: Optional[int] = None,
+        team_role: str = 'team1',
+        player_role: str = 'player1'
+    ) -> np.ndarray:
+        """
+        조건을 모두 만족하는 문서 ID 검색
+
+        Args:
+            text: 본문 검색어 (모든 단어 포함)
+            event_type: 이벤트 타입 (goal, yellow card, ...)
+            team_id: 팀 ID
+            player_id: 선수 ID
+            season: 시즌 ID
+            team_role: team_id를 찾을 역할 (기본 team1 = 이벤트 주체 팀, 'any'면 team1 / team2)
+            player_role: player_id를 찾을 역할 (기본 player1 = 이벤트 주체 선수, 'any'면 player1 / player2)
+
+        Returns:
+            정렬된 전역 문서 ID 배열
+        """
+        groups = [[token] for token in tokenize(text)] if text else []
+        if event_type is not None:
+            groups.append([FIELD_TYPE + event_type])
+        if team_id is not None:
+            groups.append(_role_terms(TEAM_ROLES, team_role, team_id))
+        if player_id is not None:
+            groups.append(_role_terms(PLAYER_ROLES, player_role, player_id))
+        if season is not None:
+            groups.append([FIELD_SEASON + str(season)])
+
+        if not groups:
+            raise ValueError("검색 조건이 하나 이상 필요합니다.")
+
+        results = [segment.search(groups) for segment in self.segments]
+        return np.concatenate(results) if results else np.empty(0, dtype=np.int64)
+
+    def documents(self, doc_ids: Iterable[int]) -> list[CommentaryDoc]:
+        """전역 문서 ID로 문서 조회"""
+        bases = np.array([segment.base_doc for segment in self.segments])
+        docs: list[CommentaryDoc] = []
+
+        for doc_id in doc_ids:
+            segment = self.segments[int(np.searchsorted(bases, doc_id, side='right')) - 1]
+            local = int(doc_id) - segment.base_doc
+
+            ids = {name: int(segment.columns[name][local]) for name in ID_COLUMNS}
+            docs.append({
+                'doc_ID': int(doc_id),
+                'match_ID': ids['match_ID'],
+                'type': segment.types[local],
+                'timestamp': format_timestamp(int(segment.timestamps[local])),
+                'team1': ids['team1'] if ids['team1'] != MISSING_ID else None,
+                'team2': ids['team2'] if ids['team2'] != MISSING_ID else None,
+                'player1': ids['player1'] if ids['player1'] != MISSING_ID else None,
+                'player2': ids['player2'] if ids['player2'] != MISSING_ID else None,
+                'comment': segment.comment(local),
+            })
+
+        return docs
+
+    def compact(self) -> None:
+        """모든 세그먼트를 하나로 병합 (문서 ID는 그대로 유지)"""
+        if len(self.segments) <= 1:
+            return
+
+        vocab: dict[str, int] = {}
+        all_terms, all_docs = [], []
+        for segment in self.segments:
+            terms, term_ids, doc_ids = segment.pairs()
+            mapping = np.array([vocab.setdefault(term, len(vocab)) for term in terms], dtype=np.int64)
+            all_terms.append(mapping[term_ids])
+            all_docs.append(doc_ids.astype(np.int64) + segment.base_doc)
+
+        name = f"seg_{self.manifest['next_segment']:06d}"
+        segment_dir = self.dir / name
+        segment_dir.mkdir(parents=True, exist_ok=True)
+
+        offsets, postings = build_postings(np.concatenate(all_terms), np.concatenate(all_docs), len(vocab))
+        np.save(segment_dir / 'offsets.npy', offsets)
+        np.save(segment_dir / 'postings.npy', postings)
+        (segment_dir / 'terms.json').write_text(json.dumps(list(vocab), ensure_ascii=False), encoding='utf-8')
+
+        # 문서 컬럼 / 본문 blob 이어 붙이기
+        np.save(segment_dir / 'timestamps.npy', np.concatenate([s.timestamps for s in self.segments]))
+        for column in ID_COLUMNS:
+            np.save(segment_dir / f"{column}.npy", np.concatenate([s.columns[column] for s in self.segments]))
+
+        types = [t for s in self.segments for t in s.types]
+        (segment_dir / 'types.json').write_text(json.dumps(types, ensure_ascii=False), encoding='utf-8')
+
+        blob_sizes = [int(s.comment_offsets[-1]) for s in self.segments]
+        comment_offsets = np.concatenate([[0]] + [
+            np.asarray(s.comment_offsets[1:]) + shift
+            for s, shift in zip(self.segments, np.cumsum([0] + blob_sizes[:-1]))
+        ])
+        np.save(segment_dir / 'comment_offsets.npy', comment_offsets.astype(np.int64))
+        with open(segment_dir / 'comments.bin', 'wb') as out:
+            for segment in self.segments:
+                out.write(segment.comments_path.read_bytes())
+
+        old_names = [info['name'] for info in self.manifest['segments']]
+        self.manifest['segments'] = [{'name': name, 'base_doc': 0, 'num_docs': self.num_docs}]
+        self.manifest['next_segment'] += 1
+        self._save_manifest()
+
+        self.segments = [Segment(segment_dir, 0)]
+        for old_name in old_names:
+            shutil.rmtree(self.dir / old_name, ignore_errors=True)
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    Commentary 역색인 CLI
+
+    Commands:
+        ingest: 라운드별 종료 경기의 중계를 수집하여 증분 색인 (라운드마다 세그먼트 1개)
+        search: 색인 검색
+        compact: 세그먼트 병합
+    """
+    parser = argparse.ArgumentParser(description="Premier League 중계 역색인")
+    parser.add_argument('--index-dir', type=Path, default=INDEX_DIR)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest')
+    ingest_parser.add_argument('--season', type=int, default=SEASON_ID)
+    ingest_parser.add_argument('--start-round', type=int, default=START_ROUND)
+    ingest_parser.add_argument('--end-round', type=int, default=END_ROUND)
+
+    search_parser = subparsers.add_parser('search')
+    search_parser.add_argument('--text')
+    search_parser.add_argument('--type', dest='event_type')
+    search_parser.add_argument('--team', type=int)
+    search_parser.add_argument('--player', type=int)
+    search_parser.add_argument('--team-role', choices=list(TEAM_ROLES) + [ROLE_ANY], default='team1')
+    search_parser.add_argument('--player-role', choices=list(PLAYER_ROLES) + [ROLE_ANY], default='player1')
+    search_parser.add_argument('--season', type=int)
+    search_parser.add_argument('--limit', type=int, default=20)
+
+    subparsers.add_parser('compact')
+
+    args = parser.parse_args()
+    index = CommentaryIndex(args.index_dir)
+
+    if args.command == 'ingest':
+        indexed = set(index.manifest['matches'])
+        with requests.Session() as session:
+            session.headers.update(HEADERS)
+            for round_num in range(args.start_round, args.end_round + 1):
+                matches_json = fetch_matches_data(session, round_num, args.season)
+                if matches_json is None:
+                    continue
+
+                matches = []
+                for match in matches_json.get('data', []):
+                    match_id = match['matchId']
+                    if match.get('period') != PERIOD_FULL_TIME or int(match_id) in indexed:
+                        continue
+                    events = fetch_commentary_events(session, match_id)
+                    if events is not None:
+                        matches.append((match_id, args.season, events))
+
+                added = index.add_matches(matches)
+                if added:
+                    console.print(f"[green]✓ Round {round_num}:[/green] {len(matches)}경기 / {added}개 문서 색인")
+
+        console.print(f"\n[green]✓ 색인 완료:[/green] 전체 {index.num_docs}개 문서, 세그먼트 {len(index.segments)}개")
+
+    elif args.command == 'search':
+        start = time.perf_counter()
+        doc_ids = index.search(
+            args.text, args.event_type, args.team, args.player, args.season, args.team_role, args.player_role
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+
+        console.print(f"[green]✓ {len(doc_ids)}건[/green] ({elapsed:.2f} ms)")
+        for doc in index.documents(doc_ids[:args.limit]):
+            console.print(f"  • [{doc['match_ID']}] {doc['timestamp']} [cyan]{doc['type']}[/cyan] {doc['comment']}")
+
+    elif args.command == 'compact':
+        index.compact()
+        console.print(f"[green]✓ 병합 완료:[/green] 세그먼트 {len(index.segments)}개")
+
+
+if __name__ == "__main__":
+    main()
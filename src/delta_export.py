@@ -0,0 +1,264 @@
+"""
+프리미어리그 데이터 변경분(CDC) 내보내기
+
+직전 내보내기 시점의 스냅샷과 새로 저장된 엑셀 파일을 (season, round, ID) 키로 비교하여
+insert / update / delete 행만 압축 CSV 델타 파일로 저장하고,
+워터마크가 기록된 manifest를 갱신합니다.
+다운스트림은 manifest의 워터마크 이후 배치만 적재하면 됩니다.
+"""
+
+import argparse
+import json
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, TypedDict
+
+import pandas as pd
+
+from main import AWAY_STATS, HOME_STATS, OVERALL_STATS, SEASON_ID, TEAMS, console
+
+# ==================== 타입 정의 ====================
+class DeltaFileInfo(TypedDict):
+    """시트별 델타 파일 정보"""
+    path: str
+    insert: int
+    update: int
+    delete: int
+
+
+class DeltaBatch(TypedDict):
+    """manifest의 배치 정보"""
+    watermark: int
+    created_at: str
+    season: int
+    max_round: Optional[int]
+    files: dict[str, DeltaFileInfo]
+
+
+# ==================== 상수 정의 ====================
+DATA_PATH = Path('data/premier_league_table_2024-25.xlsx')
+DELTA_DIR = Path('data/deltas')
+SNAPSHOT_DIR_NAME = 'snapshot'
+MANIFEST_NAME = 'manifest.json'
+
+# 시트별 키 컬럼 (season은 내보내기 시 추가)
+SHEET_KEYS = {
+    TEAMS: ['season', 'ID'],
+    OVERALL_STATS: ['season', 'round', 'ID'],
+    HOME_STATS: ['season', 'round', 'ID'],
+    AWAY_STATS: ['season', 'round', 'ID'],
+}
+
+# 변경 유형
+OP_INSERT = 'insert'
+OP_UPDATE = 'update'
+OP_DELETE = 'delete'
+
+
+# ==================== 변경분 계산 ====================
+def compute_sheet_delta(old: pd.DataFrame, new: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """
+    두 시트를 키 기준으로 비교하여 행 단위 변경분 계산
+
+    Args:
+        old: 직전 스냅샷
+        new: 새 데이터
+        keys: 키 컬럼
+
+    Returns:
+        op 컬럼(insert/update/delete)이 추가된 변경 행 DataFrame
+        (insert/update는 새 값 전체, delete는 키만)
+    """
+    if old.empty:
+        return new.assign(op=OP_INSERT)
+
+    value_columns = [c for c in new.columns if c not in keys]
+    merged = old.merge(new, on=keys, how='outer', suffixes=('_old', ''), indicator=True)
+
+    inserted = merged['_merge'] == 'right_only'
+    deleted = merged['_merge'] == 'left_only'
+
+    both = merged['_merge'] == 'both'
+    changed = pd.Series(False, index=merged.index)
+    for column in value_columns:
+        old_column = f"{column}_old"
+        if old_column not in merged:
+            changed |= both
+            continue
+        # NaN끼리는 같은 값으로 취급
+        both_missing = merged[column].isna() & merged[old_column].isna()
+        changed |= both & merged[column].ne(merged[old_column]) & ~both_missing
+
+    delta = merged[inserted | deleted | changed][keys + value_columns].copy()
+    delta['op'] = OP_UPDATE
+    delta.loc[inserted[delta.index], 'op'] = OP_INSERT
+    delta.loc[deleted[delta.index], 'op'] = OP_DELETE
+    delta.loc[delta['op'] == OP_DELETE, value_columns] = None
+
+    # outer merge로 float이 된 정수 컬럼을 nullable 정수(Int64)로 복원
+    return delta.sort_values(keys).reset_index(drop=True).convert_dtypes()
+
+
+# ==================== 스냅샷 / manifest ====================
+def snapshot_path(delta_dir: Path, watermark: int, sheet_name: str) -> Path:
+    """워터마크별 시트 스냅샷 경로"""
+    return delta_dir / SNAPSHOT_DIR_NAME / f"{watermark:06d}" / f"{sheet_name}.csv.gz"
+
+
+def load_snapshot(delta_dir: Path, watermark: int, sheet_name: str) -> pd.DataFrame:
+    """manifest 워터마크 시점의 시트 스냅샷 로드 (없으면 빈 DataFrame)"""
+    path = snapshot_path(delta_dir, watermark, sheet_name)
+    return pd.read_csv(path) if path.exists() else pd.DataFrame()
+
+
+def save_snapshot(delta_dir: Path, watermark: int, sheet_name: str, df: pd.DataFrame) -> None:
+    """새 워터마크의 시트 스냅샷 저장 (manifest가 가리키기 전까지는 읽히지 않음)"""
+    path = snapshot_path(delta_dir, watermark, sheet_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+
+
+def prune_snapshots(delta_dir: Path, watermark: int) -> None:
+    """manifest가 가리키는 워터마크 외의 스냅샷 디렉토리 삭제"""
+    snapshot_dir = delta_dir / SNAPSHOT_DIR_NAME
+    keep = f"{watermark:06d}"
+    for path in snapshot_dir.iterdir():
+        if path.is_dir() and path.name != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_manifest(delta_dir: Path) -> dict:
+    """manifest 로드 (없으면 워터마크 0)"""
+    path = delta_dir / MANIFEST_NAME
+    if not path.exists():
+        return {'watermark': 0, 'batches': []}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_manifest(delta_dir: Path, manifest: dict) -> None:
+    """manifest를 임시 파일에 쓴 뒤 교체 (다운스트림이 반쯤 쓰인 파일을 읽지 않도록)"""
+    path = delta_dir / MANIFEST_NAME
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    tmp_path.replace(path)
+
+
+# ==================== 내보내기 ====================
+def export_deltas(
+    sheets: dict[str, pd.DataFrame],
+    season_id: int,
+    delta_dir: Path = DELTA_DIR
+) -> Optional[DeltaBatch]:
+    """
+    새 데이터와 스냅샷을 비교하여 델타 파일 / manifest / 스냅샷 갱신
+
+    Args:
+        sheets: 시트명 → 새 DataFrame (엑셀 파일 로드 결과 또는 data_store 변환)
+        season_id: 시즌 ID (키 컬럼으로 추가)
+        delta_dir: 델타 파일 저장 디렉토리
+
+    Returns:
+        새로 기록된 배치 정보, 변경분이 없으면 None
+    """
+    manifest = load_manifest(delta_dir)
+    watermark = manifest['watermark'] + 1
+
+    deltas: dict[str, pd.DataFrame] = {}
+    snapshots: dict[str, pd.DataFrame] = {}
+
+    for sheet_name, keys in SHEET_KEYS.items():
+        if sheet_name not in sheets:
+            # 이번에 내보내지 않는 시트는 직전 스냅샷을 그대로 이어받음
+            snapshots[sheet_name] = load_snapshot(delta_dir, manifest['watermark'], sheet_name)
+            continue
+
+        new = sheets[sheet_name].assign(season=season_id)
+        snapshot = load_snapshot(delta_dir, manifest['watermark'], sheet_name)
+
+        # 다른 시즌 행은 그대로 두고 이번 시즌 행만 비교
+        if snapshot.empty:
+            old, others = snapshot, snapshot
+        else:
+            is_season = snapshot['season'] == season_id
+            old, others = snapshot[is_season], snapshot[~is_season]
+
+        delta = compute_sheet_delta(old, new, keys)
+        if not delta.empty:
+            deltas[sheet_name] = delta
+        snapshots[sheet_name] = pd.concat([others, new], ignore_index=True)
+
+    if not deltas:
+        return None
+
+    files: dict[str, DeltaFileInfo] = {}
+    for sheet_name, delta in deltas.items():
+        path = delta_dir / f"{watermark:06d}_{sheet_name}.csv.gz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        delta.to_csv(path, index=False)
+
+        op_counts = delta['op'].value_counts()
+        files[sheet_name] = {
+            'path': path.name,
+            'insert': int(op_counts.get(OP_INSERT, 0)),
+            'update': int(op_counts.get(OP_UPDATE, 0)),
+            'delete': int(op_counts.get(OP_DELETE, 0)),
+        }
+
+    overall = sheets.get(OVERALL_STATS)
+    batch: DeltaBatch = {
+        'watermark': watermark,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'season': season_id,
+        'max_round': int(overall['round'].max()) if overall is not None and not overall.empty else None,
+        'files': files,
+    }
+
+    # 델타 파일 → 새 워터마크 스냅샷 → manifest 순서로 기록
+    # manifest 교체가 커밋 지점이며, 그 전에 중단되면 다음 실행은 직전 스냅샷과 다시 비교하여
+    # 같은 워터마크의 델타 파일과 스냅샷을 덮어씀
+    for sheet_name, snapshot in snapshots.items():
+        if not snapshot.empty:
+            save_snapshot(delta_dir, watermark, sheet_name, snapshot)
+
+    manifest['watermark'] = watermark
+    manifest['batches'].append(batch)
+    save_manifest(delta_dir, manifest)
+    prune_snapshots(delta_dir, watermark)
+
+    return batch
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    저장된 엑셀 파일의 변경분 내보내기 (main.py 실행 후 호출)
+
+    Process:
+        1. 엑셀 파일 로드
+        2. 스냅샷과 비교하여 델타 파일 생성
+        3. manifest 워터마크 갱신
+    """
+    parser = argparse.ArgumentParser(description="Premier League 변경분 내보내기")
+    parser.add_argument('--path', type=Path, default=DATA_PATH)
+    parser.add_argument('--season', type=int, default=SEASON_ID)
+    parser.add_argument('--delta-dir', type=Path, default=DELTA_DIR)
+    args = parser.parse_args()
+
+    sheets = pd.read_excel(args.path, sheet_name=None)
+    batch = export_deltas(sheets, args.season, args.delta_dir)
+
+    if batch is None:
+        console.print("[green]✓ 변경분 없음[/green]")
+        return
+
+    console.print(f"\n[green]✓ 델타 저장 완료:[/green] watermark {batch['watermark']}")
+    for sheet_name, info in batch['files'].items():
+        console.print(
+            f"  • {sheet_name}: insert [bold]{info['insert']}[/bold] / "
+            f"update [bold]{info['update']}[/bold] / delete [bold]{info['delete']}[/bold]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+팀 / 선수 차원 테이블 및 정수 키 기반 팩트 테이블
+
+Standings / Lineups / Momentum 응답에 경기마다 반복되는 팀명, 선수명,
+포지션 문자열을 차원 테이블에 한 번만 저장하고 정수 대리키(surrogate key)를
+부여합니다. 라인업 및 경기 이벤트 팩트 행은 정수 키만 보관합니다.
+
+대리키는 실행 간에 유지되어야 하므로 기존 엑셀 파일이 있으면
+load_dimension_store()로 차원/팩트 시트를 먼저 불러온 뒤 추출을 이어갑니다.
+"""
+
+import math
+from pathlib import Path
+from typing import Hashable, Optional, TypedDict
+
+import pandas as pd
+
+from main import console, save_dataframe_to_sheet
+
+# ==================== 타입 정의 ====================
+class LineupFact(TypedDict):
+    """라인업 팩트 구조"""
+    match_ID: int
+    team_key: int
+    player_key: int
+    position_key: int
+    shirt_number: Optional[int]
+    is_starter: bool
+    is_captain: bool
+
+
+class EventFact(TypedDict, total=False):
+    """경기 이벤트 팩트 구조 (goal / card / substitute)"""
+    match_ID: int
+    event_key: int
+    team_key: int
+    player_key: int
+    related_player_key: Optional[int]  # 어시스트 선수 / 교체 OUT 선수
+    period_ID: int
+    time_min: int
+
+
+# ==================== 상수 정의 ====================
+# 차원 저장소 키
+TEAMS_DIM = 'teams'
+PLAYERS_DIM = 'players'
+POSITIONS_DIM = 'positions'
+EVENT_TYPES_DIM = 'event_types'
+
+# 팩트 저장소 키
+LINEUP_FACTS = 'lineup_facts'
+GOAL_FACTS = 'goal_facts'
+CARD_FACTS = 'card_facts'
+SUBSTITUTE_FACTS = 'substitute_facts'
+
+# 교체 이벤트 타입 (goal / card는 API의 type 값 사용)
+SUBSTITUTE_EVENT_TYPE = 'SUB'
+
+# 차원별 속성 컬럼
+DIMENSION_ATTRIBUTES = {
+    TEAMS_DIM: ['ID', 'name', 'short_name', 'code'],
+    PLAYERS_DIM: ['ID', 'first_name', 'last_name', 'short_first_name', 'short_last_name', 'match_name'],
+    POSITIONS_DIM: ['position'],
+    EVENT_TYPES_DIM: ['event_type'],
+}
+
+
+# ==================== 차원 테이블 ====================
+class DimensionTable:
+    """자연키 → 정수 대리키 매핑과 속성 행을 보관하는 차원 테이블"""
+
+    def __init__(self, attributes: list[str]):
+        self.attributes = attributes
+        self.rows: list[dict] = []
+        self._keys: dict[Hashable, int] = {}
+
+    def intern(self, natural_key: Hashable, **attrs) -> int:
+        """
+        자연키에 해당하는 대리키 반환 (처음 보는 키면 행 추가)
+
+        이미 있는 행은 비어 있던 속성만 채웁니다.
+
+        Args:
+            natural_key: 팀/선수 ID 또는 문자열 값
+            **attrs: 차원 속성 값
+
+        Returns:
+            0부터 시작하는 정수 대리키
+        """
+        key = self._keys.get(natural_key)
+
+        if key is None:
+            key = len(self.rows)
+            self._keys[natural_key] = key
+            row = {'key': key}
+            row.update({name: attrs.get(name) for name in self.attributes})
+            self.rows.append(row)
+            return key
+
+        row = self.rows[key]
+        for name, value in attrs.items():
+            if value is not None and row.get(name) is None:
+                row[name] = value
+        return key
+
+    def load_rows(self, rows: list[dict], natural_key_column: str) -> None:
+        """
+        저장된 차원 시트 행을 불러와 기존 대리키를 그대로 복원
+
+        Args:
+            rows: key 컬럼과 속성 컬럼을 가진 행 목록
+            natural_key_column: 자연키로 사용할 속성 컬럼
+
+        Raises:
+            ValueError: 대리키가 0부터 연속되지 않는 경우
+        """
+        rows = sorted(rows, key=lambda row: row['key'])
+        if [row['key'] for row in rows] != list(range(len(rows))):
+            raise ValueError("차원 시트의 key가 0부터 연속되지 않습니다")
+
+        self.rows = [{'key': row['key'], **{name: row.get(name) for name in self.attributes}} for row in rows]
+        self._keys = {row[natural_key_column]: row['key'] for row in self.rows}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def create_dimension_store() -> dict[str, DimensionTable]:
+    """빈 차원 저장소 생성"""
+    return {name: DimensionTable(attributes) for name, attributes in DIMENSION_ATTRIBUTES.items()}
+
+
+def create_fact_store() -> dict[str, list]:
+    """빈 팩트 저장소 생성"""
+    return {LINEUP_FACTS: [], GOAL_FACTS: [], CARD_FACTS: [], SUBSTITUTE_FACTS: []}
+
+
+def _sheet_rows(df: pd.DataFrame) -> list[dict]:
+    """엑셀 시트를 행 목록으로 변환 (빈 셀은 None, 정수로 읽힌 실수는 int로 복원)"""
+    rows = []
+    for record in df.to_dict('records'):
+        row = {}
+        for name, value in record.items():
+            if isinstance(value, float):
+                value = None if math.isnan(value) else int(value) if value.is_integer() else value
+            row[name] = value
+        rows.append(row)
+    return rows
+
+
+def load_dimension_store(path: Path) -> tuple[dict[str, DimensionTable], dict[str, list]]:
+    """
+    이전에 저장한 차원/팩트 시트를 불러와 저장소 복원 (파일이 없으면 빈 저장소)
+
+    Args:
+        path: save_dimensions_to_excel()로 저장한 엑셀 파일 경로
+
+    Returns:
+        (차원 저장소, 팩트 저장소)
+    """
+    dims = create_dimension_store()
+    facts = create_fact_store()
+    if not path.exists():
+        return dims, facts
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    for name, dim in dims.items():
+        if name in sheets:
+            # 자연키는 첫 번째 속성 (팀/선수 ID, 포지션/이벤트 타입 값)
+            dim.load_rows(_sheet_rows(sheets[name]), DIMENSION_ATTRIBUTES[name][0])
+    for name in facts:
+        if name in sheets:
+            facts[name] = _sheet_rows(sheets[name])
+
+    console.print(
+        f"[green]✓ 차원 불러오기:[/green] 팀 {len(dims[TEAMS_DIM])}개 / 선수 {len(dims[PLAYERS_DIM])}명"
+    )
+    return dims, facts
+
+
+def remove_match_facts(facts: dict[str, list], fact_names: list[str], match_id: int) -> None:
+    """같은 경기를 다시 추출할 때 중복되지 않도록 기존 팩트 행 제거"""
+    for name in fact_names:
+        facts[name] = [row for row in facts[name] if row['match_ID'] != match_id]
+
+
+def intern_team(dims: dict[str, DimensionTable], team_id: str | int, **attrs) -> int:
+    """팀 ID를 팀 차원 대리키로 변환"""
+    team_id = int(team_id)
+    return dims[TEAMS_DIM].intern(team_id, ID=team_id, **attrs)
+
+
+def intern_player(dims: dict[str, DimensionTable], player_id: str | int, **attrs) -> int:
+    """선수 ID(opPlayerId)를 선수 차원 대리키로 변환"""
+    player_id = int(player_id)
+    return dims[PLAYERS_DIM].intern(player_id, ID=player_id, **attrs)
+
+
+def intern_value(dims: dict[str, DimensionTable], dim_name: str, value: Optional[str]) -> int:
+    """포지션/이벤트 타입 같은 반복 문자열을 정수 코드로 변환"""
+    attribute = DIMENSION_ATTRIBUTES[dim_name][0]
+    return dims[dim_name].intern(value, **{attribute: value})
+
+
+# ==================== 응답별 추출 ====================
+def extract_standings_teams(standings_json: dict, dims: dict[str, DimensionTable]) -> None:
+    """순위표 응답의 팀 정보를 팀 차원에 등록"""
+    for table in standings_json.get('tables', []):
+        for entry in table.get('entries', []):
+            team = entry.get('team', {})
+            intern_team(
+                dims, team.get('id'),
+                name=team.get('name'), short_name=team.get('shortName'), code=team.get('abbr')
+            )
+
+
+def extract_lineups_facts(
+    lineups_json: dict,
+    match_id: str | int,
+    dims: dict[str, DimensionTable],
+    facts: dict[str, list]
+) -> None:
+    """
+    Lineups API 응답에서 라인업 팩트 추출
+
+    Args:
+        lineups_json: /v3/matches/{id}/lineups 응답 JSON 데이터
+        match_id: 경기 ID
+        dims: 차원 저장소
+        facts: 팩트 저장소
+    """
+    remove_match_facts(facts, [LINEUP_FACTS], int(match_id))
+
+    for side in ('home_team', 'away_team'):
+        team_lineup = lineups_json.get(side, {})
+        team_key = intern_team(dims, team_lineup.get('teamId'))
+
+        formation = team_lineup.get('formation', {})
+        starters = {player_id for line in formation.get('lineup', []) for player_id in line}
+
+        for player in team_lineup.get('players', []):
+            shirt_num = player.get('shirtNum')
+            facts[LINEUP_FACTS].append({
+                'match_ID': int(match_id),
+                'team_key': team_key,
+                'player_key': intern_player(
+                    dims, player.get('id'),
+                    first_name=player.get('firstName'), last_name=player.get('lastName')
+                ),
+                'position_key': intern_value(dims, POSITIONS_DIM, player.get('position')),
+                'shirt_number': int(shirt_num) if shirt_num else None,
+                'is_starter': player.get('id') in starters,
+                'is_captain': bool(player.get('isCaptain')),
+            })
+
+
+def extract_momentum_facts(
+    momentum_json: dict,
+    dims: dict[str, DimensionTable],
+    facts: dict[str, list]
+) -> None:
+    """
+    Momentum API 응답에서 선수/팀 차원과 goal / card / substitute 팩트 추출
+
+    Args:
+        momentum_json: /v1/matches/{id}/momentum 응답 JSON 데이터
+        dims: 차원 저장소
+        facts: 팩트 저장소
+    """
+    match_info = momentum_json.get('matchInfo', {})
+    live_data = momentum_json.get('liveData', {})
+    match_id = int(match_info.get('opId'))
+    remove_match_facts(facts, [GOAL_FACTS, CARD_FACTS, SUBSTITUTE_FACTS], match_id)
+
+    for contestant in match_info.get('contestant', []):
+        intern_team(
+            dims, contestant.get('opId'),
+            name=contestant.get('name'), short_name=contestant.get('shortName'), code=contestant.get('code')
+        )
+
+    # 라인업의 상세 선수 정보로 선수 차원 보강
+    for line_up in live_data.get('lineUp', []):
+        for player in line_up.get('player', []):
+            intern_player(
+                dims, player.get('opPlayerId'),
+                first_name=player.get('firstName'),
+                last_name=player.get('lastName'),
+                short_first_name=player.get('shortFirstName'),
+                short_last_name=player.get('shortLastName'),
+                match_name=player.get('matchName'),
+            )
+
+    def base_fact(event: dict, event_type: str) -> EventFact:
+        return {
+            'match_ID': match_id,
+            'event_key': intern_value(dims, EVENT_TYPES_DIM, event_type),
+            'team_key': intern_team(dims, event.get('opContestantId')),
+            'period_ID': event.get('periodId'),
+            'time_min': event.get('timeMin'),
+        }
+
+    for goal in live_data.get('goal', []):
+        fact = base_fact(goal, goal.get('type'))
+        fact['player_key'] = intern_player(dims, goal.get('opScorerId'), match_name=goal.get('scorerName'))
+        assist_id = goal.get('opAssistPlayerId')
+        fact['related_player_key'] = intern_player(dims, assist_id) if assist_id else None
+        facts[GOAL_FACTS].append(fact)
+
+    for card in live_data.get('card', []):
+        fact = base_fact(card, card.get('type'))
+        fact['player_key'] = intern_player(dims, card.get('opPlayerId'), match_name=card.get('playerName'))
+        facts[CARD_FACTS].append(fact)
+
+    for sub in live_data.get('substitute', []):
+        fact = base_fact(sub, SUBSTITUTE_EVENT_TYPE)
+        fact['player_key'] = intern_player(dims, sub.get('opPlayerOnId'), match_name=sub.get('playerOnName'))
+        fact['related_player_key'] = intern_player(
+            dims, sub.get('opPlayerOffId'), match_name=sub.get('playerOffName')
+        )
+        facts[SUBSTITUTE_FACTS].append(fact)
+
+
+# ==================== 엑셀 저장 ====================
+def save_dimensions_to_excel(
+    dims: dict[str, DimensionTable],
+    facts: dict[str, list],
+    output_path: Path
+) -> None:
+    """
+    차원 테이블과 팩트 테이블을 시트별로 나눠서 엑셀 파일로 저장
+
+    다음 실행에서 load_dimension_store()로 불러올 수 있도록 전체 저장소를 다시 씁니다.
+
+    Args:
+        dims: 차원 저장소
+        facts: 팩트 저장소
+        output_path: 저장할 엑셀 파일 경로
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    counts = {}
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        for sheet_name, dim in dims.items():
+            counts[sheet_name] = save_dataframe_to_sheet(writer, dim.rows, sheet_name, 'key')
+        for sheet_name, rows in facts.items():
+            counts[sheet_name] = save_dataframe_to_sheet(writer, rows, sheet_name, 'match_ID')
+
+    console.print(f"\n[green]✓ 저장 완료:[/green] {output_path}")
+    for sheet_name, count in counts.items():
+        console.print(f"  • {sheet_name}: [bold]{count}[/bold]개 레코드")
@@ -0,0 +1,462 @@
+"""
+프리미어리그 팀 간 상대 전적(head-to-head) 인덱스
+
+Preview API의 headToHead 통산 전적으로 팀 쌍(team × team) 카운터를 seed하고,
+이후 종료된 경기 결과를 matchId 기준으로 중복 제거하여 더해 승/무/패, 득실,
+최근 N경기 맞대결(previousMeetings + 경기 결과)을 미리 집계해 둡니다.
+경기가 끝날 때마다 해당 팀 쌍만 증분 갱신하므로 조회는 dict 조회 한 번(O(1))이며,
+preview는 팀 쌍마다 한 번만 요청하면 됩니다.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Iterable, Optional, TypedDict
+
+import requests
+
+from main import (
+    END_ROUND,
+    HEADERS,
+    PERIOD_FULL_TIME,
+    SEASON_ID,
+    START_ROUND,
+    console,
+)
+from request_planner import (
+    KIND_MATCHES,
+    KIND_PREVIEW,
+    Resource,
+    build_request_plan,
+    execute_request_plan,
+)
+
+# ==================== 타입 정의 ====================
+class Meeting(TypedDict):
+    """맞대결 경기 구조"""
+    match_ID: int
+    kickoff: str
+    home_ID: int
+    away_ID: int
+    home_score: int
+    away_score: int
+
+
+class HeadToHeadRecord(TypedDict):
+    """팀 A 기준 상대 전적 구조"""
+    team_A: int
+    team_B: int
+    played: int
+    team_A_wins: int
+    team_B_wins: int
+    draws: int
+    team_A_goals: int
+    team_B_goals: int
+    team_A_home_wins: int
+    team_B_home_wins: int
+    last_meetings: list[Meeting]
+
+
+# ==================== 상수 정의 ====================
+INDEX_PATH = Path('data/head_to_head.json')
+
+# 팀 쌍마다 보관할 최근 맞대결 수
+LAST_N_MEETINGS = 5
+
+# 집계 카운터 (팀 쌍의 작은 ID 팀 = low, 큰 ID 팀 = high 기준)
+COUNTER_KEYS = [
+    'played', 'low_wins', 'high_wins', 'draws',
+    'low_goals', 'high_goals', 'low_home_wins', 'high_home_wins',
+]
+
+
+# ==================== 경기 변환 ====================
+def meeting_from_preview(previous: dict) -> Optional[Meeting]:
+    """Preview API previousMeetings 항목을 Meeting으로 변환 (점수가 없으면 None)"""
+    home, away = previous.get('homeTeam', {}), previous.get('awayTeam', {})
+    if home.get('score') is None or away.get('score') is None:
+        return None
+
+    return {
+        'match_ID': int(previous['matchId']),
+        'kickoff': previous.get('kickoff', ''),
+        'home_ID': int(home['team']['id']),
+        'away_ID': int(away['team']['id']),
+        'home_score': int(home['score']),
+        'away_score': int(away['score']),
+    }
+
+
+def meeting_from_match(match: dict) -> Optional[Meeting]:
+    """Matches API(v2) 경기를 Meeting으로 변환 (종료되지 않은 경기는 None)"""
+    if match.get('period') != PERIOD_FULL_TIME:
+        return None
+
+    home, away = match['homeTeam'], match['awayTeam']
+    return {
+        'match_ID': int(match['matchId']),
+        'kickoff': match.get('kickoff', ''),
+        'home_ID': int(home['id']),
+        'away_ID': int(away['id']),
+        'home_score': int(home['score']),
+        'away_score': int(away['score']),
+    }
+
+
+def pair_key(team_a: int, team_b: int) -> tuple[int, int]:
+    """방향 없는 팀 쌍 키 (작은 ID, 큰 ID)"""
+    return (team_a, team_b) if team_a < team_b else (team_b, team_a)
+
+
+def seed_from_head_to_head(head_to_head: dict) -> Optional[tuple[tuple[int, int], dict[str, int]]]:
+    """
+    Preview API headToHead 블록을 (팀 쌍, low/high 기준 카운터)로 변환
+
+    Args:
+        head_to_head: preview 응답의 headToHead (teamA 기준 통산 전적)
+
+    Returns:
+        (팀 쌍 키, 카운터), 팀 정보가 없으면 None
+    """
+    if not head_to_head.get('teamA') or not head_to_head.get('teamB'):
+        return None
+
+    team_a, team_b = int(head_to_head['teamA']), int(head_to_head['teamB'])
+    a, b = ('low', 'high') if team_a < team_b else ('high', 'low')
+    a_wins, b_wins, draws = (int(head_to_head.get(k, 0)) for k in ('teamAWins', 'teamBWins', 'draws'))
+
+    counters = {
+        'played': a_wins + b_wins + draws,
+        f"{a}_wins": a_wins,
+        f"{b}_wins": b_wins,
+        'draws': draws,
+        f"{a}_goals": int(head_to_head.get('teamAGoals', 0)),
+        f"{b}_goals": int(head_to_head.get('teamBGoals', 0)),
+        f"{a}_home_wins": int(head_to_head.get('teamAHomeWins', 0)),
+        f"{b}_home_wins": int(head_to_head.get('teamBHomeWins', 0)),
+    }
+    return pair_key(team_a, team_b), counters
+
+
+def apply_meeting(counters: dict[str, int], meeting: Meeting) -> None:
+    """low/high 기준 카운터에 맞대결 한 경기 결과를 더함"""
+    low, _ = pair_key(meeting['home_ID'], meeting['away_ID'])
+    home_is_low = meeting['home_ID'] == low
+    low_score = meeting['home_score'] if home_is_low else meeting['away_score']
+    high_score = meeting['away_score'] if home_is_low else meeting['home_score']
+
+    counters['played'] += 1
+    counters['low_goals'] += low_score
+    counters['high_goals'] += high_score
+    if low_score == high_score:
+        counters['draws'] += 1
+    elif low_score > high_score:
+        counters['low_wins'] += 1
+        counters['low_home_wins'] += int(home_is_low)
+    else:
+        counters['high_wins'] += 1
+        counters['high_home_wins'] += int(not home_is_low)
+
+
+# ==================== 인덱스 ====================
+class HeadToHeadIndex:
+    """
+    팀 쌍별 상대 전적 집계와 최근 맞대결을 보관하는 인덱스
+
+    팀 쌍 항목 구조:
+        seed: preview headToHead의 통산 카운터 (없으면 None)
+        seed_kickoff: seed에 포함된 마지막 맞대결 킥오프 (previousMeetings 기준)
+        results: 종료 경기 결과로 반영한 맞대결 (seed 이후 경기만 카운터에 더함)
+        counters: seed + seed 이후 results
+        last_meetings: 최근 N경기 (킥오프 내림차순)
+    """
+
+    def __init__(self, last_n: int = LAST_N_MEETINGS):
+        self.last_n = last_n
+        self.pairs: dict[tuple[int, int], dict] = {}
+        self.match_ids: set[int] = set()
+        self.preview_pairs: set[tuple[int, int]] = set()
+
+    def _entry(self, key: tuple[int, int]) -> dict:
+        return self.pairs.setdefault(key, {
+            'seed': None,
+            'seed_kickoff': '',
+            'results': [],
+            'counters': dict.fromkeys(COUNTER_KEYS, 0),
+            'last_meetings': [],
+        })
+
+    def _remember(self, entry: dict, meeting: Meeting) -> None:
+        """최근 N경기 (킥오프 내림차순) 유지"""
+        last_meetings = entry['last_meetings']
+        if any(m['match_ID'] == meeting['match_ID'] for m in last_meetings):
+            return
+        last_meetings.append(meeting)
+        last_meetings.sort(key=lambda m: m['kickoff'], reverse=True)
+        del last_meetings[self.last_n:]
+
+    def _recount(self, entry: dict) -> None:
+        """seed와 seed 이후 결과로 카운터 재계산 (seed 갱신 시에만 호출)"""
+        counters = dict(entry['seed']) if entry['seed'] else dict.fromkeys(COUNTER_KEYS, 0)
+        for meeting in entry['results']:
+            if meeting['kickoff'] > entry['seed_kickoff']:
+                apply_meeting(counters, meeting)
+        entry['counters'] = counters
+
+    def add_meeting(self, meeting: Meeting) -> bool:
+        """
+        종료된 맞대결 한 경기를 해당 팀 쌍 집계에 반영
+
+        preview headToHead에 이미 포함된 경기(seed_kickoff 이전)는 최근 맞대결에만 반영합니다.
+
+        Args:
+            meeting: 맞대결 경기
+
+        Returns:
+            새로 반영했으면 True, 이미 반영된 matchId면 False
+        """
+        if meeting['match_ID'] in self.match_ids:
+            return False
+        self.match_ids.add(meeting['match_ID'])
+
+        entry = self._entry(pair_key(meeting['home_ID'], meeting['away_ID']))
+        entry['results'].append(meeting)
+        if meeting['kickoff'] > entry['seed_kickoff']:
+            apply_meeting(entry['counters'], meeting)
+        self._remember(entry, meeting)
+
+        return True
+
+    def add_preview(self, preview_json: dict) -> int:
+        """
+        Preview API 응답 반영
+
+        headToHead 통산 전적으로 팀 쌍 카운터를 seed하고, previousMeetings는
+        최근 맞대결과 seed 기준 시점(seed_kickoff)에만 사용합니다.
+        headToHead가 없으면 previousMeetings를 결과로 반영합니다.
+
+        Args:
+            preview_json: /v2/matches/{id}/preview 응답 JSON 데이터
+
+        Returns:
+            새로 알게 된 맞대결 수
+        """
+        meetings = [
+            meeting for meeting in map(meeting_from_preview, preview_json.get('previousMeetings', []))
+            if meeting is not None
+        ]
+        seed = seed_from_head_to_head(preview_json.get('headToHead') or {})
+        if seed is None:
+            for meeting in meetings:
+                self.preview_pairs.add(pair_key(meeting['home_ID'], meeting['away_ID']))
+            return sum(self.add_meeting(meeting) for meeting in meetings)
+
+        key, counters = seed
+        self.preview_pairs.add(key)
+        entry = self._entry(key)
+        entry['seed'] = counters
+        entry['seed_kickoff'] = max((m['kickoff'] for m in meetings), default='')
+
+        added = 0
+        for meeting in meetings:
+            if meeting['match_ID'] not in self.match_ids:
+                self.match_ids.add(meeting['match_ID'])
+                added += 1
+            self._remember(entry, meeting)
+
+        self._recount(entry)
+        return added
+
+    def add_matches(self, matches_json: dict) -> int:
+        """
+        Matches API 응답의 종료된 경기 반영
+
+        Args:
+            matches_json: /v2/matches 응답 JSON 데이터
+
+        Returns:
+            새로 반영된 경기 수
+        """
+        added = 0
+        for match in matches_json.get('data', []):
+            meeting = meeting_from_match(match)
+            if meeting is not None:
+                added += self.add_meeting(meeting)
+        return added
+
+    def needs_preview(self, team_a: int, team_b: int) -> bool:
+        """팀 쌍의 통산 전적을 아직 preview로 채우지 않았는지 여부"""
+        return pair_key(team_a, team_b) not in self.preview_pairs
+
+    def lookup(self, team_a: int, team_b: int) -> Optional[HeadToHeadRecord]:
+        """
+        팀 A 기준 상대 전적 조회
+
+        Args:
+            team_a: 기준 팀 ID
+            team_b: 상대 팀 ID
+
+        Returns:
+            상대 전적, 맞대결 기록이 없으면 None
+        """
+        entry = self.pairs.get(pair_key(team_a, team_b))
+        if entry is None:
+            return None
+
+        counters = entry['counters']
+        a, b = ('low', 'high') if team_a < team_b else ('high', 'low')
+        return {
+            'team_A': team_a,
+            'team_B': team_b,
+            'played': counters['played'],
+            'team_A_wins': counters[f"{a}_wins"],
+            'team_B_wins': counters[f"{b}_wins"],
+            'draws': counters['draws'],
+            'team_A_goals': counters[f"{a}_goals"],
+            'team_B_goals': counters[f"{b}_goals"],
+            'team_A_home_wins': counters[f"{a}_home_wins"],
+            'team_B_home_wins': counters[f"{b}_home_wins"],
+            'last_meetings': list(entry['last_meetings']),
+        }
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        """인덱스를 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'last_n': self.last_n,
+            'match_IDs': sorted(self.match_ids),
+            'preview_pairs': sorted(self.preview_pairs),
+            'pairs': [
+                {'teams': list(key), **entry} for key, entry in sorted(self.pairs.items())
+            ],
+        }
+        tmp_path = path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> 'HeadToHeadIndex':
+        """저장된 인덱스 로드 (파일이 없으면 빈 인덱스)"""
+        if not path.exists():
+            return cls()
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        index = cls(data['last_n'])
+        index.match_ids = set(data['match_IDs'])
+        index.preview_pairs = {tuple(pair) for pair in data['preview_pairs']}
+        index.pairs = {
+            tuple(pair.pop('teams')): pair for pair in data['pairs']
+        }
+        return index
+
+
+# ==================== 인덱스 구축 ====================
+def update_head_to_head(
+    session: requests.Session,
+    index: HeadToHeadIndex,
+    rounds: Iterable[int],
+    season_id: int = SEASON_ID
+) -> int:
+    """
+    라운드들의 종료된 경기를 인덱스에 반영
+
+    경기 목록과 preview는 요청 계획(request_planner)으로 모아 병렬 요청하며,
+    처음 보는 팀 쌍은 그 쌍의 첫 종료 경기 preview를 한 번만 요청하여 통산 전적을 채웁니다.
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        index: 갱신할 인덱스
+        rounds: 라운드 번호 목록
+        season_id: 시즌 ID
+
+    Returns:
+        새로 반영된 맞대결 수
+    """
+    rounds = list(rounds)
+    matches_plan = build_request_plan(Resource(KIND_MATCHES, season_id, round_num) for round_num in rounds)
+    matches_results = execute_request_plan(session, matches_plan)
+
+    meetings: list[Meeting] = []
+    previews: dict[tuple[int, int], Resource] = {}
+    for round_num in rounds:
+        matches_json = matches_results.get(Resource(KIND_MATCHES, season_id, round_num))
+        for match in (matches_json or {}).get('data', []):
+            meeting = meeting_from_match(match)
+            if meeting is None:
+                continue
+            meetings.append(meeting)
+
+            key = pair_key(meeting['home_ID'], meeting['away_ID'])
+            if index.needs_preview(*key) and key not in previews:
+                previews[key] = Resource(KIND_PREVIEW, season_id, round_num, match['matchId'])
+
+    added = 0
+    preview_results = execute_request_plan(session, build_request_plan(previews.values()))
+    for preview_json in preview_results.values():
+        if preview_json is not None:
+            added += index.add_preview(preview_json)
+
+    for meeting in meetings:
+        added += index.add_meeting(meeting)
+
+    return added
+
+
+# ==================== 결과 출력 ====================
+def print_head_to_head(record: Optional[HeadToHeadRecord]) -> None:
+    """상대 전적과 최근 맞대결 출력"""
+    if record is None:
+        console.print("[yellow]맞대결 기록 없음[/yellow]")
+        return
+
+    console.print(
+        f"[bold]{record['team_A']} vs {record['team_B']}[/bold]: {record['played']}경기 "
+        f"{record['team_A_wins']}승 {record['draws']}무 {record['team_B_wins']}패 "
+        f"({record['team_A_goals']}:{record['team_B_goals']})"
+    )
+    for meeting in record['last_meetings']:
+        console.print(
+            f"  • {meeting['kickoff']} {meeting['home_ID']} "
+            f"{meeting['home_score']}-{meeting['away_score']} {meeting['away_ID']}"
+        )
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    상대 전적 인덱스 CLI
+
+    Commands:
+        update: 라운드별 종료 경기 반영 (이미 반영된 경기는 건너뜀)
+        show: 두 팀의 상대 전적 조회
+    """
+    parser = argparse.ArgumentParser(description="Premier League 상대 전적 인덱스")
+    parser.add_argument('--path', type=Path, default=INDEX_PATH)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = subparsers.add_parser('update')
+    update_parser.add_argument('--season', type=int, default=SEASON_ID)
+    update_parser.add_argument('--start-round', type=int, default=START_ROUND)
+    update_parser.add_argument('--end-round', type=int, default=END_ROUND)
+
+    show_parser = subparsers.add_parser('show')
+    show_parser.add_argument('team_a', type=int)
+    show_parser.add_argument('team_b', type=int)
+
+    args = parser.parse_args()
+    index = HeadToHeadIndex.load(args.path)
+
+    if args.command == 'update':
+        with requests.Session() as session:
+            session.headers.update(HEADERS)
+            rounds = range(args.start_round, args.end_round + 1)
+            added = update_head_to_head(session, index, rounds, args.season)
+        index.save(args.path)
+        console.print(f"[green]✓ 갱신 완료:[/green] {added}경기 반영, 팀 쌍 {len(index.pairs)}개")
+
+    elif args.command == 'show':
+        print_head_to_head(index.lookup(args.team_a, args.team_b))
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,18 @@ END_ROUND = 38
 BASE_URL = "https://sdp-prem-prod.premier-league-prod.pulselive.com"
 TEAMS_API_URL = f"{BASE_URL}/api/v1/competitions/{{comp_id}}/seasons/{{season_id}}/teams?_limit=20"
 STANDINGS_API_URL = f"{BASE_URL}/api/v5/competitions/{{comp_id}}/seasons/{{season_id}}/matchweeks/{{matchweek}}/standings"
+MATCHES_API_URL = f"{BASE_URL}/api/v2/matches?competition={{comp_id}}&season={{season_id}}&matchweek={{matchweek}}&_limit=20"
+MATCH_RESOURCE_URLS = {
+    'stats': f"{BASE_URL}/api/v3/matches/{{match_id}}/stats",
+    'lineups': f"{BASE_URL}/api/v3/matches/{{match_id}}/lineups",
+    'momentum': f"{BASE_URL}/api/v1/matches/{{match_id}}/momentum",
+    'preview': f"{BASE_URL}/api/v2/matches/{{match_id}}/preview",
+    'commentary': f"{BASE_URL}/api/v1/matches/{{match_id}}/commentary?_limit=100",
+}
+
+# Matches API의 종료된 경기 상태
+PERIOD_FULL_TIME = 'FullTime'
+
 LOGO_URL_TEMPLATE = "https://resources.premierleague.com/premierleague25/badges-alt/{team_id}.svg"
 
 # HTTP 설정
@@ -200,9 +212,9 @@ def process_stats_if_played(
 
 
 # ==================== Teams 데이터 수집 ====================
-def fetch_teams_data(session: requests.Session) -> Optional[dict]:
+def fetch_teams_data(session: requests.Session, season_id: int = SEASON_ID) -> Optional[dict]:
     """프리미어리그 팀 데이터를 API에서 가져옴"""
-    url = TEAMS_API_URL.format(comp_id=COMPETITION_ID, season_id=SEASON_ID)
+    url = TEAMS_API_URL.format(comp_id=COMPETITION_ID, season_id=season_id)
     return fetch_with_retry(session, url)
 
 
@@ -239,11 +251,15 @@ def extract_teams_data(teams_json: dict) -> list[TeamData]:
 
 
 # ==================== Standings 데이터 수집 ====================
-def fetch_standings_data(session: requests.Session, round_num: int) -> Optional[dict]:
+def fetch_standings_data(
+    session: requests.Session,
+    round_num: int,
+    season_id: int = SEASON_ID
+) -> Optional[dict]:
     """프리미어리그 순위표 데이터를 API에서 가져옴"""
     url = STANDINGS_API_URL.format(
         comp_id=COMPETITION_ID,
-        season_id=SEASON_ID,
+        season_id=season_id,
         matchweek=round_num
     )
     return fetch_with_retry(session, url, context=f"Round {round_num}")
@@ -299,6 +315,68 @@ def extract_standings_data(
         )
 
 
+# ==================== Matches 데이터 수집 ====================
+def fetch_matches_data(
+    session: requests.Session,
+    round_num: int,
+    season_id: int = SEASON_ID
+) -> Optional[dict]:
+    """프리미어리그 라운드별 경기 일정/결과 데이터를 API에서 가져옴"""
+    url = MATCHES_API_URL.format(
+        comp_id=COMPETITION_ID,
+        season_id=season_id,
+        matchweek=round_num
+    )
+    return fetch_with_retry(session, url, context=f"Matches {round_num}")
+
+
+def fetch_match_resource(
+    session: requests.Session,
+    resource: str,
+    match_id: str
+) -> Optional[dict | list]:
+    """
+    경기 단위 API(stats, lineups, momentum, preview, commentary) 데이터를 가져옴
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        resource: MATCH_RESOURCE_URLS의 키
+        match_id: 경기 ID
+
+    Returns:
+        성공 시 응답 JSON, 실패 시 None
+    """
+    url = MATCH_RESOURCE_URLS[resource].format(match_id=match_id)
+    return fetch_with_retry(session, url, context=f"Match {match_id} {resource}")
+
+
+def fetch_commentary_events(session: requests.Session, match_id: str) -> Optional[list[dict]]:
+    """
+    Commentary API의 모든 페이지를 pagination._next 토큰으로 따라가며 중계 이벤트 수집
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        match_id: 경기 ID
+
+    Returns:
+        전체 중계 이벤트 목록, 한 페이지라도 요청 실패 시 None (일부만 저장되지 않도록)
+    """
+    base_url = MATCH_RESOURCE_URLS['commentary'].format(match_id=match_id)
+    url = base_url
+    events: list[dict] = []
+
+    while True:
+        page = fetch_with_retry(session, url, context=f"Match {match_id} commentary")
+        if page is None:
+            return None
+
+        events.extend(page.get('data', []))
+        next_token = page.get('pagination', {}).get('_next')
+        if not next_token:
+            return events
+        url = f"{base_url}&_next={next_token}"
+
+
 # ==================== 엑셀 저장 ====================
 def save_dataframe_to_sheet(
     writer: pd.ExcelWriter,
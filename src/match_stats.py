@@ -0,0 +1,264 @@
+"""
+프리미어리그 경기별 팀 통계 컬럼형 행렬
+
+Stats API(/v3/matches/{id}/stats)의 팀별 통계 dict(100개 이상의 키)를
+고정된 컬럼 스키마에 한 번만 매핑한 뒤, 시즌 단위로 미리 할당한
+int32 / float32 행렬의 행으로 바로 디코딩합니다.
+팀별 시즌 누적 및 최근 N경기 롤링 집계는 (round, ID) 기준으로
+overall_stats에 조인할 수 있습니다.
+"""
+
+from typing import Iterable, Optional, TypedDict
+
+import numpy as np
+import pandas as pd
+
+from main import StatsData
+
+# ==================== 타입 정의 ====================
+class StatsSchema(TypedDict):
+    """통계 키 → 컬럼 매핑 구조"""
+    int_columns: list[str]
+    float_columns: list[str]
+    int_index: dict[str, int]
+    float_index: dict[str, int]
+
+
+# ==================== 상수 정의 ====================
+# 시즌 기본 행 수 (20팀 × 38라운드)
+SEASON_ROWS = 760
+
+# side 코드
+SIDE_CODES = {'Home': 0, 'Away': 1}
+
+# 롤링 집계 기본 경기 수
+ROLLING_WINDOW = 5
+
+
+# ==================== 스키마 ====================
+def build_stats_schema(payloads: Iterable[list[dict]]) -> StatsSchema:
+    """
+    Stats API 응답들의 키 어휘를 스캔하여 고정 컬럼 스키마 생성
+
+    Args:
+        payloads: Stats API 응답 리스트 (응답 하나 = 팀별 dict 2개)
+
+    Returns:
+        숫자형 키만 포함한 컬럼 스키마 (한 번이라도 실수값이면 float 컬럼)
+    """
+    numeric_keys: set[str] = set()
+    float_keys: set[str] = set()
+
+    for payload in payloads:
+        for side in payload:
+            for key, value in side.get('stats', {}).items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                numeric_keys.add(key)
+                if isinstance(value, float):
+                    float_keys.add(key)
+
+    int_columns = sorted(numeric_keys - float_keys)
+    float_columns = sorted(float_keys)
+
+    return {
+        'int_columns': int_columns,
+        'float_columns': float_columns,
+        'int_index': {key: i for i, key in enumerate(int_columns)},
+        'float_index': {key: i for i, key in enumerate(float_columns)},
+    }
+
+
+# ==================== 컬럼형 행렬 ====================
+class TeamStatsMatrix:
+    """시즌 단위 경기별 팀 통계 행렬 (행 = 경기 × 팀)"""
+
+    def __init__(self, schema: StatsSchema, capacity: int = SEASON_ROWS):
+        self.schema = schema
+        self.size = 0
+
+        self.season = np.zeros(capacity, dtype=np.int16)
+        self.round = np.zeros(capacity, dtype=np.int16)
+        self.match_id = np.zeros(capacity, dtype=np.int64)
+        self.team_id = np.zeros(capacity, dtype=np.int32)
+        self.side = np.zeros(capacity, dtype=np.int8)
+
+        # 누락 키: 정수 카운터는 0 (API가 0인 항목을 생략), 실수 지표는 NaN
+        self.int_values = np.zeros((capacity, len(schema['int_columns'])), dtype=np.int32)
+        self.float_values = np.full((capacity, len(schema['float_columns'])), np.nan, dtype=np.float32)
+
+    def _grow(self, min_capacity: int) -> None:
+        """용량이 부족하면 두 배씩 확장"""
+        capacity = len(self.round)
+        if min_capacity <= capacity:
+            return
+
+        new_capacity = max(min_capacity, capacity * 2)
+        for name in ['season', 'round', 'match_id', 'team_id', 'side', 'int_values']:
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+
+        new_float = np.full((new_capacity, self.float_values.shape[1]), np.nan, dtype=np.float32)
+        new_float[:capacity] = self.float_values
+        self.float_values = new_float
+
+    def append(self, payload: list[dict], match_id: str, round_num: int, season_id: int) -> None:
+        """
+        Stats API 응답 하나(홈/원정 2개 팀)를 행렬에 추가
+
+        Args:
+            payload: Stats API 응답
+            match_id: 경기 ID
+            round_num: 라운드 번호 (matchWeek)
+            season_id: 시즌 ID
+        """
+        self._grow(self.size + len(payload))
+        int_index = self.schema['int_index']
+        float_index = self.schema['float_index']
+
+        for side in payload:
+            row = self.size
+            self.season[row] = season_id
+            self.round[row] = round_num
+            self.match_id[row] = int(match_id)
+            self.team_id[row] = int(side.get('teamId'))
+            self.side[row] = SIDE_CODES.get(side.get('side'), -1)
+
+            # 존재하는 키만 컬럼 인덱스로 모아 한 번에 대입
+            stats = side.get('stats', {})
+            int_cols, int_vals, float_cols, float_vals = [], [], [], []
+            for key, value in stats.items():
+                if key in int_index:
+                    int_cols.append(int_index[key])
+                    int_vals.append(value)
+                elif key in float_index:
+                    float_cols.append(float_index[key])
+                    float_vals.append(value)
+
+            self.int_values[row, int_cols] = int_vals
+            self.float_values[row, float_cols] = float_vals
+            self.size += 1
+
+    def to_frame(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        행렬을 DataFrame으로 변환
+
+        Args:
+            columns: 포함할 통계 컬럼 (None이면 전체)
+
+        Returns:
+            메타 컬럼 + 통계 컬럼 DataFrame
+        """
+        n = self.size
+        int_columns = self.schema['int_columns']
+        float_columns = self.schema['float_columns']
+        wanted = set(columns) if columns is not None else None
+
+        data = {
+            'season': self.season[:n],
+            'round': self.round[:n],
+            'match_ID': self.match_id[:n],
+            'ID': self.team_id[:n],
+            'side': self.side[:n],
+        }
+        for i, key in enumerate(int_columns):
+            if wanted is None or key in wanted:
+                data[key] = self.int_values[:n, i]
+        for i, key in enumerate(float_columns):
+            if wanted is None or key in wanted:
+                data[key] = self.float_values[:n, i]
+
+        return pd.DataFrame(data)
+
+
+def build_stats_matrix(
+    payloads: list[tuple[list[dict], str, int, int]],
+    schema: Optional[StatsSchema] = None
+) -> TeamStatsMatrix:
+    """
+    (응답, 경기 ID, 라운드, 시즌) 목록으로 통계 행렬 생성
+
+    Args:
+        payloads: Stats API 응답과 경기 메타 정보 목록
+        schema: 고정 컬럼 스키마 (None이면 payloads에서 생성)
+
+    Returns:
+        채워진 TeamStatsMatrix
+    """
+    if schema is None:
+        schema = build_stats_schema(payload for payload, *_ in payloads)
+
+    matrix = TeamStatsMatrix(schema, capacity=max(len(payloads) * 2, 1))
+    for payload, match_id, round_num, season_id in payloads:
+        matrix.append(payload, match_id, round_num, season_id)
+    return matrix
+
+
+# ==================== 집계 ====================
+def team_stat_aggregates(
+    matrix: TeamStatsMatrix,
+    columns: list[str],
+    window: int = ROLLING_WINDOW
+) -> pd.DataFrame:
+    """
+    팀별 시즌 누적 / 경기당 평균 / 최근 N경기 롤링 평균 계산
+
+    Args:
+        matrix: 통계 행렬
+        columns: 집계할 통계 컬럼
+        window: 롤링 평균 경기 수
+
+    Returns:
+        (season, round, ID) 단위 집계 DataFrame
+        ({컬럼}_total, {컬럼}_avg, {컬럼}_last{window})
+    """
+    df = matrix.to_frame(columns).sort_values(['season', 'ID', 'round']).reset_index(drop=True)
+    values = df[columns].astype(np.float64)
+    grouped = values.groupby([df['season'], df['ID']])
+
+    totals = grouped.cumsum().add_suffix('_total')
+    played = df.groupby(['season', 'ID']).cumcount() + 1
+    averages = totals.div(played, axis=0)
+    averages.columns = [f"{c}_avg" for c in columns]
+    rolling = (
+        grouped.rolling(window, min_periods=1).mean()
+        .reset_index(level=[0, 1], drop=True)
+        .sort_index()
+        .add_suffix(f"_last{window}")
+    )
+
+    return pd.concat([df[['season', 'round', 'ID']], totals, averages, rolling], axis=1)
+
+
+def join_overall_stats(
+    overall_stats: list[StatsData] | pd.DataFrame,
+    aggregates: pd.DataFrame,
+    season_id: int
+) -> pd.DataFrame:
+    """
+    시즌 집계를 overall_stats에 (round, ID) 기준으로 조인
+
+    경기가 없던 라운드는 직전 라운드 집계를 이어받습니다.
+
+    Args:
+        overall_stats: 라운드별 누적 overall_stats
+        aggregates: team_stat_aggregates() 결과
+        season_id: 조인할 시즌 ID
+
+    Returns:
+        집계 컬럼이 추가된 overall_stats DataFrame
+    """
+    stats_df = pd.DataFrame(overall_stats).sort_values('round')
+    season_aggregates = (
+        aggregates[aggregates['season'] == season_id]
+        .drop(columns='season')
+        .astype({'round': np.int64, 'ID': np.int64})
+        .sort_values('round')
+    )
+
+    merged = pd.merge_asof(
+        stats_df, season_aggregates, on='round', by='ID', direction='backward'
+    )
+    return merged.sort_values(['round', 'position']).reset_index(drop=True)
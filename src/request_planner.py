@@ -0,0 +1,177 @@
+"""
+프리미어리그 API 요청 계획 및 중복 요청 병합
+
+수집에 필요한 리소스 전체를 먼저 모은 뒤 중복 요청을 정리하고, 동시에 발생한
+동일 URL 요청은 진행 중인 하나의 Future로 병합하여 fetch_with_retry 호출 수를 줄입니다.
+"""
+
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional, TypedDict
+
+import requests
+
+from main import (
+    COMPETITION_ID,
+    MATCH_RESOURCE_URLS,
+    MATCHES_API_URL,
+    STANDINGS_API_URL,
+    TEAMS_API_URL,
+    console,
+    fetch_with_retry,
+)
+
+# ==================== 타입 정의 ====================
+class Resource(NamedTuple):
+    """API 리소스 식별자 (URL 하나에 대응)"""
+    kind: str
+    season: int
+    round: Optional[int] = None
+    match_ID: Optional[str] = None
+
+
+class RequestPlan(TypedDict):
+    """요청 계획 구조"""
+    requested: int           # 요청된 리소스 수 (중복 포함)
+    fetch: list[Resource]    # 실제로 요청할 리소스
+
+
+# ==================== 상수 정의 ====================
+# 리소스 종류
+KIND_TEAMS = 'teams'
+KIND_STANDINGS = 'standings'
+KIND_MATCHES = 'matches'
+KIND_PREVIEW = 'preview'
+
+DEFAULT_MAX_WORKERS = 4
+
+# 세션별 공유 병합기 (병합기는 세션을 약한 참조로만 보관하므로 세션이 해제되면 함께 해제)
+_COALESCERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_COALESCERS_LOCK = threading.Lock()
+
+
+# ==================== 요청 계획 ====================
+def resource_url(resource: Resource) -> str:
+    """리소스 식별자를 요청 URL로 변환"""
+    kind = resource.kind
+
+    if kind == KIND_TEAMS:
+        return TEAMS_API_URL.format(comp_id=COMPETITION_ID, season_id=resource.season)
+    if kind == KIND_STANDINGS:
+        return STANDINGS_API_URL.format(
+            comp_id=COMPETITION_ID, season_id=resource.season, matchweek=resource.round
+        )
+    if kind == KIND_MATCHES:
+        return MATCHES_API_URL.format(
+            comp_id=COMPETITION_ID, season_id=resource.season, matchweek=resource.round
+        )
+    if kind in MATCH_RESOURCE_URLS:
+        return MATCH_RESOURCE_URLS[kind].format(match_id=resource.match_ID)
+
+    raise ValueError(f"알 수 없는 리소스 종류: {kind}")
+
+
+def build_request_plan(requested: Iterable[Resource]) -> RequestPlan:
+    """
+    필요한 리소스 목록에서 중복 요청을 정리한 요청 계획 생성
+
+    Args:
+        requested: 필요한 리소스 목록 (중복 허용)
+
+    Returns:
+        요청 계획
+    """
+    fetch: dict[Resource, None] = {}  # 순서 유지용 ordered set
+    requested_count = 0
+
+    for resource in requested:
+        requested_count += 1
+        fetch.setdefault(resource)
+
+    return {'requested': requested_count, 'fetch': list(fetch)}
+
+
+# ==================== 동시 요청 병합 ====================
+class InFlightCoalescer:
+    """동일 URL에 대한 동시 요청을 진행 중인 하나의 Future로 병합"""
+
+    def __init__(self, session: requests.Session):
+        # 강한 참조를 두면 _COALESCERS의 키(세션)가 해제되지 않으므로 약한 참조로 보관
+        self._session = weakref.ref(session)
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+
+    def fetch(self, url: str, context: str = "") -> Optional[dict | list]:
+        """
+        진행 중인 같은 요청이 있으면 그 결과를 기다리고, 없으면 직접 요청
+
+        Args:
+            url: 요청할 URL
+            context: 로그 출력에 사용할 컨텍스트 정보
+
+        Returns:
+            성공 시 응답 JSON, 실패 시 None
+        """
+        with self._lock:
+            future = self._in_flight.get(url)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[url] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            future.set_result(fetch_with_retry(self._session(), url, context))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[url]
+
+        return future.result()
+
+
+def get_coalescer(session: requests.Session) -> InFlightCoalescer:
+    """세션별로 공유되는 병합기 반환 (같은 세션의 모든 요청 계획 / 스레드가 공유)"""
+    with _COALESCERS_LOCK:
+        coalescer = _COALESCERS.get(session)
+        if coalescer is None:
+            coalescer = InFlightCoalescer(session)
+            _COALESCERS[session] = coalescer
+        return coalescer
+
+
+def fetch_resource(session: requests.Session, resource: Resource) -> Optional[dict | list]:
+    """리소스 하나를 공유 병합기를 거쳐 요청"""
+    context = f"{resource.kind} {resource.match_ID or resource.round or resource.season}"
+    return get_coalescer(session).fetch(resource_url(resource), context)
+
+
+def execute_request_plan(
+    session: requests.Session,
+    plan: RequestPlan,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> dict[Resource, Optional[dict | list]]:
+    """
+    요청 계획을 스레드 풀에서 실행하고 원래 요청된 리소스 기준으로 결과 반환
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        plan: build_request_plan() 결과
+        max_workers: 동시 요청 수
+
+    Returns:
+        리소스 → 응답 JSON (실패 시 None)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = executor.map(lambda resource: fetch_resource(session, resource), plan['fetch'])
+        results = dict(zip(plan['fetch'], fetched))
+
+    saved = plan['requested'] - len(plan['fetch'])
+    if saved:
+        console.print(f"[green]✓ 요청 계획:[/green] {len(plan['fetch'])}건 요청 ({saved}건 중복 제거)")
+
+    return results
@@ -0,0 +1,289 @@
+"""
+프리미어리그 순위표 조회용 로컬 HTTP API 서버
+
+수집된 엑셀 파일을 한 번만 메모리에 올리고, 라운드별 순위표 / 팀 순위 추이 /
+홈·원정 성적 조회 결과를 LRU 캐시에서 바로 응답합니다.
+엑셀 파일이 다시 저장되면(새 라운드 수집) 데이터를 다시 읽고 캐시를 비우며,
+ETag / If-None-Match 조건부 요청에는 304로 응답합니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from main import AWAY_STATS, HOME_STATS, OVERALL_STATS, TEAMS, console
+
+# ==================== 상수 정의 ====================
+# 서버 설정
+HOST = '127.0.0.1'
+PORT = 8000
+DATA_PATH = Path('data/premier_league_table_2024-25.xlsx')
+
+# 캐시 설정
+CACHE_SIZE = 512
+RELOAD_CHECK_INTERVAL = 1.0  # 엑셀 파일 변경 확인 주기(초)
+
+# 조회 가능한 통계 시트
+STATS_VIEWS = {'overall': OVERALL_STATS, 'home': HOME_STATS, 'away': AWAY_STATS}
+
+
+# ==================== 데이터셋 ====================
+class Dataset:
+    """엑셀 파일을 메모리에 올려두고 파일 변경 시 다시 읽는 데이터셋"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.version = 0
+        self.sheets: dict[str, pd.DataFrame] = {}
+        self._mtime_ns: Optional[int] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self.reload_if_changed(force=True)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        엑셀 파일이 바뀌었으면 다시 읽음
+
+        Args:
+            force: 확인 주기와 관계없이 즉시 확인
+
+        Returns:
+            다시 읽었으면 True
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < RELOAD_CHECK_INTERVAL:
+            return False
+
+        with self._lock:
+            self._last_check = now
+            try:
+                mtime_ns = self.path.stat().st_mtime_ns
+                if mtime_ns == self._mtime_ns:
+                    return False
+                sheets = pd.read_excel(self.path, sheet_name=None)
+            except Exception as e:
+                # 수집기가 파일을 다시 쓰는 중이면 읽기가 실패할 수 있으므로 이전 데이터로 계속 응답
+                # (다음 확인 주기에 다시 시도, 최초 로드 실패는 그대로 전달)
+                if not self.sheets:
+                    raise
+                console.print(
+                    f"[yellow]⚠ 데이터 다시 읽기 실패, 이전 데이터(version {self.version}) 유지: {e}[/yellow]"
+                )
+                return False
+
+            self.sheets = sheets
+            self._mtime_ns = mtime_ns
+            self.version += 1
+
+        console.print(f"[green]✓ 데이터 로드:[/green] {self.path} (version {self.version})")
+        return True
+
+    @property
+    def last_round(self) -> int:
+        """수집된 마지막 라운드"""
+        overall = self.sheets[OVERALL_STATS]
+        return int(overall['round'].max()) if not overall.empty else 0
+
+
+# ==================== 조회 함수 ====================
+def latest_until_round(df: pd.DataFrame, round_num: int) -> pd.DataFrame:
+    """라운드 이하 레코드 중 팀별 마지막 레코드 (home/away는 경기한 라운드만 존재)"""
+    rows = df[df['round'] <= round_num]
+    return rows.sort_values('round').groupby('ID', as_index=False).last()
+
+
+def query_table(dataset: Dataset, round_num: int, view: str) -> list[dict]:
+    """라운드 종료 시점 순위표"""
+    df = latest_until_round(dataset.sheets[STATS_VIEWS[view]], round_num)
+    if view == 'overall':
+        df = df.sort_values('position')
+    else:
+        # 홈/원정 시트의 position은 해당 라운드 기준이므로 승점 > 득실차 > 다득점으로 재정렬
+        df = df.assign(goal_difference=df['goals_for'] - df['goals_against'])
+        df = df.sort_values(['points', 'goal_difference', 'goals_for'], ascending=False)
+    return to_records(df)
+
+
+def query_trajectory(dataset: Dataset, team_id: int) -> list[dict]:
+    """팀의 라운드별 순위 / 승점 추이"""
+    df = dataset.sheets[OVERALL_STATS]
+    rows = df[df['ID'] == team_id].sort_values('round')
+    return to_records(rows[['round', 'position', 'points', 'goals_for', 'goals_against', 'played']])
+
+
+def query_split(dataset: Dataset, team_id: int, round_num: int) -> dict:
+    """팀의 라운드 종료 시점 홈 / 원정 성적"""
+    split = {}
+    for view in ('home', 'away'):
+        df = latest_until_round(dataset.sheets[STATS_VIEWS[view]], round_num)
+        records = to_records(df[df['ID'] == team_id])
+        split[view] = records[0] if records else None
+    return split
+
+
+def to_records(df: pd.DataFrame) -> list[dict]:
+    """DataFrame을 JSON 직렬화 가능한 레코드 리스트로 변환"""
+    return json.loads(df.to_json(orient='records', force_ascii=False))
+
+
+# ==================== 캐시 ====================
+class LRUCache:
+    """스레드 안전 LRU 캐시 (데이터셋 버전이 바뀌면 전체 무효화)"""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = 0
+        self._entries: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, version: int) -> Optional[tuple[bytes, str]]:
+        """캐시된 (본문, ETag) 조회"""
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+                return None
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, version: int, entry: tuple[bytes, str]) -> None:
+        """(본문, ETag) 저장"""
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# ==================== HTTP 핸들러 ====================
+def resolve_route(dataset: Dataset, path: str, params: dict[str, list[str]]) -> Optional[object]:
+    """
+    요청 경로를 조회 함수에 연결
+
+    Routes:
+        /teams
+        /table?round=N&view=overall|home|away
+        /teams/{id}/trajectory
+        /teams/{id}/split?round=N
+
+    Returns:
+        응답 데이터, 경로가 없으면 None
+    """
+    round_num = int(params.get('round', [dataset.last_round])[0])
+    parts = [part for part in path.split('/') if part]
+
+    if parts == ['teams']:
+        return to_records(dataset.sheets[TEAMS])
+    if parts == ['table']:
+        view = params.get('view', ['overall'])[0]
+        if view not in STATS_VIEWS:
+            raise ValueError(f"view는 {list(STATS_VIEWS)} 중 하나여야 합니다.")
+        return query_table(dataset, round_num, view)
+    if len(parts) == 3 and parts[0] == 'teams' and parts[2] == 'trajectory':
+        return query_trajectory(dataset, int(parts[1]))
+    if len(parts) == 3 and parts[0] == 'teams' and parts[2] == 'split':
+        return query_split(dataset, int(parts[1]), round_num)
+
+    return None
+
+
+def make_handler(dataset: Dataset, cache: LRUCache) -> type[BaseHTTPRequestHandler]:
+    """데이터셋과 캐시를 공유하는 요청 핸들러 클래스 생성"""
+
+    class StandingsHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            dataset.reload_if_changed()
+            version = dataset.version
+
+            url = urlparse(self.path)
+            cache_key = f"{url.path}?{url.query}"
+            entry = cache.get(cache_key, version)
+
+            if entry is None:
+                try:
+                    result = resolve_route(dataset, url.path, parse_qs(url.query))
+                except ValueError as e:
+                    error = json.dumps({'error': str(e)}, ensure_ascii=False).encode('utf-8')
+                    self.send_json(HTTPStatus.BAD_REQUEST, error)
+                    return
+
+                if result is None:
+                    self.send_json(HTTPStatus.NOT_FOUND, b'{"error": "not found"}')
+                    return
+
+                body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+                etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+                entry = (body, etag)
+                cache.put(cache_key, version, entry)
+
+            body, etag = entry
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            self.send_json(HTTPStatus.OK, body, etag)
+
+        def send_json(self, status: HTTPStatus, body: bytes, etag: Optional[str] = None) -> None:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            if etag:
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            # 요청마다 콘솔 출력하지 않음
+            pass
+
+    return StandingsHandler
+
+
+def create_server(
+    data_path: Path = DATA_PATH,
+    host: str = HOST,
+    port: int = PORT
+) -> ThreadingHTTPServer:
+    """요청마다 스레드로 처리하는 HTTP 서버 생성"""
+    dataset = Dataset(data_path)
+    return ThreadingHTTPServer((host, port), make_handler(dataset, LRUCache()))
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """조회 API 서버 실행"""
+    server = create_server()
+    console.print(
+        f"\n[bold magenta]═══ Premier League Standings API (http://{HOST}:{PORT}) ═══[/bold magenta]\n"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]서버 종료[/yellow]")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+"""
+프리미어리그 잔여 시즌 몬테카를로 시뮬레이터
+
+현재 overall_stats 누적 순위와 Matches API의 잔여 경기 일정을 바탕으로
+남은 시즌을 NumPy 벡터 연산으로 대량 시뮬레이션하여
+라운드별 우승 / Top 4 / 강등 확률을 계산합니다.
+
+경기별 승/무/패 확률은 팀별 득실 기록으로 추정합니다. Momentum API의 predictions는
+분 단위 공격 강도 지표(Home / Away / Combined)일 뿐 경기 결과 확률을 담고 있지
+않으므로 사용하지 않습니다.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, Optional, TypedDict
+
+import numpy as np
+import pandas as pd
+import requests
+from rich.progress import track
+from rich.table import Table
+
+from main import (
+    END_ROUND,
+    HEADERS,
+    OVERALL_STATS,
+    PERIOD_FULL_TIME,
+    SEASON_ID,
+    START_ROUND,
+    StatsData,
+    console,
+    fetch_matches_data,
+)
+
+# ==================== 타입 정의 ====================
+class FixtureData(TypedDict):
+    """잔여 경기 데이터 구조"""
+    round: int
+    match_ID: str
+    home_ID: int
+    away_ID: int
+
+
+# ==================== 상수 정의 ====================
+# 시뮬레이션 설정
+NUM_SIMULATIONS = 200_000
+SHARD_SIZE = 25_000
+DEFAULT_SEED = 2024
+
+# 경기 결과 모델 설정
+HOME_ADVANTAGE = 1.15      # 홈 팀 기대 득점 배율
+MIN_GOAL_RATE = 0.2        # 기대 득점 하한 (표본이 적은 팀 보정)
+MAX_GOALS = 10             # 승/무/패 확률 계산 시 포아송 분포 절단 상한
+
+# 순위 구간 설정
+TOP_FOUR = 4
+RELEGATION_SPOTS = 3
+
+# 순위 비교 키 설정 (승점 > 득실차 > 다득점 > 시뮬레이션별 무작위 추첨)
+RANK_SCALE = 1000
+
+
+# ==================== 입력 데이터 정리 ====================
+def extract_remaining_fixtures(matches_json: dict) -> list[FixtureData]:
+    """
+    Matches API 응답에서 아직 종료되지 않은 경기만 추출
+
+    Args:
+        matches_json: /v2/matches 응답 JSON 데이터
+
+    Returns:
+        잔여 경기 리스트
+    """
+    fixtures: list[FixtureData] = []
+
+    for match in matches_json.get('data', []):
+        if match.get('period') == PERIOD_FULL_TIME:
+            continue
+
+        fixtures.append({
+            'round': int(match.get('matchWeek')),
+            'match_ID': match.get('matchId'),
+            'home_ID': int(match.get('homeTeam', {}).get('id')),
+            'away_ID': int(match.get('awayTeam', {}).get('id')),
+        })
+
+    return fixtures
+
+
+def build_current_table(overall_stats: list[StatsData] | pd.DataFrame) -> pd.DataFrame:
+    """
+    라운드별 누적 overall_stats에서 팀별 최신 순위표를 추출
+
+    Args:
+        overall_stats: overall_stats 레코드 리스트 또는 DataFrame
+
+    Returns:
+        팀 ID 순으로 정렬된 최신 순위표 DataFrame
+    """
+    df = pd.DataFrame(overall_stats)
+    latest = df.sort_values('round').groupby('ID', as_index=False).last()
+    return latest.sort_values('ID').reset_index(drop=True)
+
+
+def estimate_goal_rates(
+    table: pd.DataFrame,
+    home_idx: np.ndarray,
+    away_idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    팀별 득점/실점 기록으로 경기별 홈/원정 기대 득점을 추정
+
+    Args:
+        table: build_current_table()로 만든 최신 순위표
+        home_idx: 경기별 홈 팀 인덱스 배열
+        away_idx: 경기별 원정 팀 인덱스 배열
+
+    Returns:
+        (홈 기대 득점 배열, 원정 기대 득점 배열)
+    """
+    played = table['played'].to_numpy(dtype=np.float64)
+    goals_for = table['goals_for'].to_numpy(dtype=np.float64)
+    goals_against = table['goals_against'].to_numpy(dtype=np.float64)
+
+    league_avg = goals_for.sum() / max(played.sum(), 1.0)
+    safe_played = np.where(played > 0, played, 1.0)
+
+    # 경기 수가 0인 팀은 리그 평균 전력으로 간주
+    attack = np.where(played > 0, goals_for / safe_played / league_avg, 1.0)
+    defence = np.where(played > 0, goals_against / safe_played / league_avg, 1.0)
+
+    lam_home = league_avg * attack[home_idx] * defence[away_idx] * HOME_ADVANTAGE
+    lam_away = league_avg * attack[away_idx] * defence[home_idx] / HOME_ADVANTAGE
+
+    return np.maximum(lam_home, MIN_GOAL_RATE), np.maximum(lam_away, MIN_GOAL_RATE)
+
+
+def outcome_probabilities_from_rates(lam_home: np.ndarray, lam_away: np.ndarray) -> np.ndarray:
+    """
+    독립 포아송 득점 모델로 경기별 (홈승, 무, 원정승) 확률 계산
+
+    Args:
+        lam_home: 경기별 홈 기대 득점
+        lam_away: 경기별 원정 기대 득점
+
+    Returns:
+        (경기 수, 3) 확률 배열
+    """
+    goals = np.arange(MAX_GOALS + 1)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(goals[1:]))))
+
+    def poisson_pmf(lam: np.ndarray) -> np.ndarray:
+        return np.exp(goals * np.log(lam[:, None]) - lam[:, None] - log_factorial)
+
+    # joint[k, h, a] = P(홈 h골, 원정 a골)
+    joint = poisson_pmf(lam_home)[:, :, None] * poisson_pmf(lam_away)[:, None, :]
+
+    probs = np.stack([
+        np.tril(joint, k=-1).sum(axis=(1, 2)),
+        np.trace(joint, axis1=1, axis2=2),
+        np.triu(joint, k=1).sum(axis=(1, 2)),
+    ], axis=1)
+
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+# ==================== 벡터화 시뮬레이션 ====================
+def rank_table(
+    points: np.ndarray,
+    goal_diff: np.ndarray,
+    goals_for: np.ndarray,
+    tiebreak: np.ndarray
+) -> np.ndarray:
+    """
+    승점 > 득실차 > 다득점 > 무작위 추첨 순서로 순위 계산 (마지막 축 기준)
+
+    완전 동률을 배열 위치(팀 ID 순)로 가르면 낮은 ID 팀이 항상 유리해지므로
+    시뮬레이션마다 뽑은 팀 순열로 동률을 가릅니다 (상대 전적 / 플레이오프 근사).
+
+    Args:
+        points: 팀별 승점 배열 (..., 팀 수)
+        goal_diff: 팀별 득실차 배열
+        goals_for: 팀별 득점 배열
+        tiebreak: 팀별 0 ~ 팀 수-1 사이의 서로 다른 추첨 값 (클수록 유리)
+
+    Returns:
+        팀별 0부터 시작하는 순위 배열 (입력과 같은 shape)
+    """
+    num_teams = points.shape[-1]
+    key = (
+        (points.astype(np.int64) * RANK_SCALE + goal_diff + RANK_SCALE // 2) * RANK_SCALE
+        + goals_for
+    ) * num_teams + tiebreak
+    order = np.argsort(-key, axis=-1)
+
+    positions = np.empty_like(order)
+    ranks = np.broadcast_to(np.arange(num_teams), order.shape)
+    np.put_along_axis(positions, order, ranks, axis=-1)
+    return positions
+
+
+def _simulate_shard(
+    seed: np.random.SeedSequence,
+    num_sims: int,
+    base: np.ndarray,
+    rounds: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    시뮬레이션 샤드 하나를 실행 (프로세스 풀 워커에서 호출)
+
+    Args:
+        seed: 샤드 전용 SeedSequence
+        num_sims: 샤드 내 시뮬레이션 횟수
+        base: (3, 팀 수) 현재 승점 / 득실차 / 득점 배열
+        rounds: 라운드별 (홈 인덱스, 원정 인덱스, 결과 확률, 홈 기대득점, 원정 기대득점)
+
+    Returns:
+        (라운드별 팀×순위 카운트, 라운드별 팀 승점 합계)
+    """
+    rng = np.random.default_rng(seed)
+    num_teams = base.shape[1]
+    identity = np.eye(num_teams, dtype=np.int32)
+
+    points = np.tile(base[0], (num_sims, 1)).astype(np.int32)
+    goal_diff = np.tile(base[1], (num_sims, 1)).astype(np.int32)
+    goals_for = np.tile(base[2], (num_sims, 1)).astype(np.int32)
+
+    # 시뮬레이션마다 한 번 뽑은 동률 추첨 순서 (시즌 내내 유지)
+    tiebreak = rng.permuted(np.tile(np.arange(num_teams), (num_sims, 1)), axis=1)
+
+    position_counts = np.zeros((len(rounds), num_teams, num_teams), dtype=np.int64)
+    points_sum = np.zeros((len(rounds), num_teams), dtype=np.int64)
+    team_offsets = np.arange(num_teams) * num_teams
+
+    for i, (home_idx, away_idx, probs, lam_home, lam_away) in enumerate(rounds):
+        # 경기 결과 샘플링 (시뮬레이션 × 경기)
+        u = rng.random((num_sims, len(home_idx)))
+        home_win = u < probs[:, 0]
+        draw = ~home_win & (u < probs[:, 0] + probs[:, 1])
+        away_win = ~(home_win | draw)
+
+        # 득실차 타이브레이커용 스코어 샘플링 후 결과와 일치하도록 보정
+        home_goals = rng.poisson(lam_home, u.shape)
+        away_goals = rng.poisson(lam_away, u.shape)
+        home_goals = np.where(home_win & (home_goals <= away_goals), away_goals + 1, home_goals)
+        away_goals = np.where(away_win & (away_goals <= home_goals), home_goals + 1, away_goals)
+        away_goals = np.where(draw, home_goals, away_goals)
+
+        # 원-핫 행렬 곱으로 팀별 누적 (같은 라운드 중복 경기도 합산)
+        home_onehot = identity[home_idx]
+        away_onehot = identity[away_idx]
+        home_points = (3 * home_win + draw).astype(np.int32)
+        away_points = (3 * away_win + draw).astype(np.int32)
+        margin = (home_goals - away_goals).astype(np.int32)
+
+        points += home_points @ home_onehot + away_points @ away_onehot
+        goal_diff += margin @ home_onehot - margin @ away_onehot
+        goals_for += home_goals.astype(np.int32) @ home_onehot + away_goals.astype(np.int32) @ away_onehot
+
+        positions = rank_table(points, goal_diff, goals_for, tiebreak)
+        position_counts[i] = np.bincount(
+            (team_offsets + positions).ravel(), minlength=num_teams * num_teams
+        ).reshape(num_teams, num_teams)
+        points_sum[i] = points.sum(axis=0)
+
+    return position_counts, points_sum
+
+
+def summarize_probabilities(
+    team_ids: np.ndarray,
+    position_counts: np.ndarray,
+    points_sum: np.ndarray,
+    num_sims: int
+) -> pd.DataFrame:
+    """
+    팀×순위 카운트를 확률 테이블로 변환
+
+    Args:
+        team_ids: 팀 ID 배열
+        position_counts: (팀 수, 팀 수) 순위별 카운트
+        points_sum: 팀별 승점 합계
+        num_sims: 전체 시뮬레이션 횟수
+
+    Returns:
+        팀별 우승 / Top 4 / 강등 확률 및 기대 승점·순위 DataFrame
+    """
+    num_teams = len(team_ids)
+    position_probs = position_counts / num_sims
+
+    df = pd.DataFrame({
+        'ID': team_ids,
+        'title': position_probs[:, 0],
+        'top_four': position_probs[:, :TOP_FOUR].sum(axis=1),
+        'relegation': position_probs[:, num_teams - RELEGATION_SPOTS:].sum(axis=1),
+        'expected_points': points_sum / num_sims,
+        'expected_position': position_probs @ np.arange(1, num_teams + 1),
+    })
+    return df.sort_values('expected_position').reset_index(drop=True)
+
+
+def iter_round_probabilities(
+    overall_stats: list[StatsData] | pd.DataFrame,
+    fixtures: list[FixtureData],
+    num_sims: int = NUM_SIMULATIONS,
+    shard_size: int = SHARD_SIZE,
+    max_workers: Optional[int] = None,
+    seed: int = DEFAULT_SEED
+) -> Iterator[tuple[int, pd.DataFrame]]:
+    """
+    잔여 시즌을 프로세스 풀에서 샤드 단위로 시뮬레이션하고 라운드별 확률 테이블을 생성
+
+    Args:
+        overall_stats: 라운드별 누적 overall_stats
+        fixtures: 잔여 경기 리스트
+        num_sims: 전체 시뮬레이션 횟수
+        shard_size: 샤드당 시뮬레이션 횟수
+        max_workers: 프로세스 풀 워커 수 (None이면 CPU 수)
+        seed: 난수 시드
+
+    Yields:
+        (라운드 번호, 해당 라운드 종료 시점 확률 테이블)
+    """
+    table = build_current_table(overall_stats)
+    team_ids = table['ID'].to_numpy()
+    team_index = {int(team_id): i for i, team_id in enumerate(team_ids)}
+
+    known = [f for f in fixtures if f['home_ID'] in team_index and f['away_ID'] in team_index]
+    if len(known) < len(fixtures):
+        console.print(f"[yellow]순위표에 없는 팀의 경기 {len(fixtures) - len(known)}건 제외[/yellow]")
+    if not known:
+        return
+
+    fixtures_df = pd.DataFrame(known).sort_values(['round', 'match_ID']).reset_index(drop=True)
+    home_idx = fixtures_df['home_ID'].map(team_index).to_numpy()
+    away_idx = fixtures_df['away_ID'].map(team_index).to_numpy()
+
+    lam_home, lam_away = estimate_goal_rates(table, home_idx, away_idx)
+    probs = outcome_probabilities_from_rates(lam_home, lam_away)
+
+    # 라운드 단위로 경기 배열 분할
+    round_numbers = fixtures_df['round'].unique()
+    rounds = []
+    for round_num in round_numbers:
+        mask = (fixtures_df['round'] == round_num).to_numpy()
+        rounds.append((home_idx[mask], away_idx[mask], probs[mask], lam_home[mask], lam_away[mask]))
+
+    goals_for = table['goals_for'].to_numpy()
+    base = np.stack([
+        table['points'].to_numpy(),
+        goals_for - table['goals_against'].to_numpy(),
+        goals_for,
+    ]).astype(np.int32)
+
+    # 샤드 분할 (각 샤드는 독립 SeedSequence 사용)
+    shard_sizes = [min(shard_size, num_sims - start) for start in range(0, num_sims, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+
+    num_teams = len(team_ids)
+    position_counts = np.zeros((len(rounds), num_teams, num_teams), dtype=np.int64)
+    points_sum = np.zeros((len(rounds), num_teams), dtype=np.int64)
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_simulate_shard, shard_seed, size, base, rounds)
+            for shard_seed, size in zip(seeds, shard_sizes)
+        ]
+        for future in as_completed(futures):
+            shard_counts, shard_points = future.result()
+            position_counts += shard_counts
+            points_sum += shard_points
+
+    for i, round_num in enumerate(round_numbers):
+        yield int(round_num), summarize_probabilities(
+            team_ids, position_counts[i], points_sum[i], num_sims
+        )
+
+
+# ==================== 결과 출력 ====================
+def print_probability_table(
+    probabilities: pd.DataFrame,
+    round_num: int,
+    team_names: Optional[dict[int, str]] = None
+) -> None:
+    """
+    확률 테이블을 rich Table로 출력
+
+    Args:
+        probabilities: summarize_probabilities() 결과
+        round_num: 라운드 번호
+        team_names: 팀 ID → 팀명 매핑 (없으면 ID 출력)
+    """
+    team_names = team_names or {}
+    table = Table(title=f"Round {round_num} 종료 시점 예측")
+
+    for column in ['팀', '우승', 'Top 4', '강등', '기대 승점', '기대 순위']:
+        table.add_column(column, justify='left' if column == '팀' else 'right')
+
+    for row in probabilities.itertuples(index=False):
+        table.add_row(
+            team_names.get(int(row.ID), str(row.ID)),
+            f"{row.title:.1%}",
+            f"{row.top_four:.1%}",
+            f"{row.relegation:.1%}",
+            f"{row.expected_points:.1f}",
+            f"{row.expected_position:.1f}",
+        )
+
+    console.print(table)
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    잔여 시즌 시뮬레이션 실행
+
+    Process:
+        1. 엑셀 파일에서 overall_stats / teams 로드
+        2. Matches API에서 잔여 경기 수집
+        3. 시뮬레이션 후 최종 라운드 확률 테이블 출력
+    """
+    parser = argparse.ArgumentParser(description="Premier League 잔여 시즌 시뮬레이터")
+    parser.add_argument('--path', type=Path, default=Path('data/premier_league_table_2024-25.xlsx'))
+    parser.add_argument('--season', type=int, default=SEASON_ID)
+    args = parser.parse_args()
+
+    console.print("\n[bold magenta]═══ Premier League Season Simulator ═══[/bold magenta]\n")
+
+    sheets = pd.read_excel(args.path, sheet_name=[OVERALL_STATS, 'teams'])
+    overall_stats = sheets[OVERALL_STATS]
+    team_names = dict(zip(sheets['teams']['ID'], sheets['teams']['short_name']))
+
+    console.print("[cyan]Step 1:[/cyan] 잔여 경기 수집 중...")
+    fixtures: list[FixtureData] = []
+
+    with requests.Session() as session:
+        session.headers.update(HEADERS)
+
+        for round_num in track(range(START_ROUND, END_ROUND + 1), description="         진행"):
+            matches_json = fetch_matches_data(session, round_num, args.season)
+            if matches_json is None:
+                console.print(f"[yellow][Matches {round_num}] 데이터 수집 실패, 건너뜀[/yellow]")
+                continue
+            fixtures.extend(extract_remaining_fixtures(matches_json))
+
+    if not fixtures:
+        console.print("[yellow]⚠ 잔여 경기가 없습니다. 시즌이 종료되었습니다.[/yellow]\n")
+        return
+
+    console.print(f"[green]✓ 완료:[/green] 잔여 경기 {len(fixtures)}개\n")
+    console.print(f"[cyan]Step 2:[/cyan] {NUM_SIMULATIONS:,}회 시뮬레이션 중...")
+
+    final = None
+    for round_num, probabilities in iter_round_probabilities(overall_stats, fixtures):
+        final = (round_num, probabilities)
+
+    if final is not None:
+        print_probability_table(final[1], final[0], team_names)
+
+    console.print("\n[bold green]═══ 모든 작업 완료! ═══[/bold green]\n")
+
+
+if __name__ == "__main__":
+    main()
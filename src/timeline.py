@@ -0,0 +1,424 @@
+"""
+프리미어리그 경기 이벤트 타임라인
+
+Momentum(goal / card / substitute / predictions), Lineups, Commentary 응답은
+각자의 시간 필드(timeMinSec, timeMin, timestamp) 순서로 이미 정렬되어 있으므로,
+소스별 제너레이터를 heapq.merge로 k-way 병합하여 (period, 경기 시계) 순서의
+단일 이벤트 스트림을 만들고 SQLite에 바로 기록합니다.
+팀 / 선수 ID는 차원 테이블(dimensions.py)로 한 번만 정규화합니다.
+"""
+
+import argparse
+import heapq
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TypedDict
+
+from rich.progress import track
+
+from dimensions import (
+    PLAYERS_DIM,
+    TEAMS_DIM,
+    DimensionTable,
+    create_dimension_store,
+    intern_player,
+    intern_team,
+)
+from main import console
+from work_queue import JOB_MATCH, QUEUE_PATH, load_result, make_job, open_queue
+
+# ==================== 타입 정의 ====================
+class TimelineEvent(TypedDict):
+    """정규화된 타임라인 이벤트 구조"""
+    period_ID: int
+    clock_sec: int                       # 경기 시계(초), 킥오프 전 이벤트는 음수
+    minute: str
+    source: str
+    event_type: str
+    team_ID: Optional[int]
+    player_ID: Optional[int]
+    related_player_ID: Optional[int]     # 어시스트 / 교체 OUT / 두 번째 선수
+    home_value: Optional[float]          # momentum 예측값
+    away_value: Optional[float]
+    detail: Optional[str]
+
+
+# ==================== 상수 정의 ====================
+TIMELINE_PATH = Path('data/timeline.sqlite3')
+
+# 킥오프 전(라인업 / 사전 중계) 이벤트의 period
+PERIOD_PRE_MATCH = 0
+
+# period별 경기 시계 시작 분 (전반 / 후반 / 연장 전반 / 연장 후반)
+PERIOD_START_MINUTE = {1: 0, 2: 45, 3: 90, 4: 105}
+
+# 이벤트 소스
+SOURCE_LINEUPS = 'lineups'
+SOURCE_GOAL = 'goal'
+SOURCE_CARD = 'card'
+SOURCE_SUBSTITUTE = 'substitute'
+SOURCE_MOMENTUM = 'momentum'
+SOURCE_COMMENTARY = 'commentary'
+
+# 라인업 이벤트 타입
+EVENT_STARTER = 'starter'
+EVENT_BENCH = 'bench'
+EVENT_SUBSTITUTE = 'SUB'
+EVENT_MOMENTUM = 'momentum'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS timeline (
+    match_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    period_id INTEGER NOT NULL,
+    clock_sec INTEGER NOT NULL,
+    minute TEXT,
+    source TEXT NOT NULL,
+    event_type TEXT,
+    team_id INTEGER,
+    player_id INTEGER,
+    related_player_id INTEGER,
+    home_value REAL,
+    away_value REAL,
+    detail TEXT,
+    PRIMARY KEY (match_id, seq)
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    short_name TEXT,
+    code TEXT
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    first_name TEXT,
+    last_name TEXT,
+    match_name TEXT
+);
+"""
+
+
+# ==================== 시간 변환 ====================
+def parse_utc(value: str) -> datetime:
+    """'2026-01-03T17:40:36Z' / '2026-01-03 17:40:36' 형식을 UTC datetime으로 변환"""
+    return datetime.fromisoformat(value.replace('Z', '')).replace(tzinfo=timezone.utc)
+
+
+def parse_clock(time_min_sec: str) -> int:
+    """'53:05' 형식 경기 시계를 초로 변환"""
+    minutes, seconds = time_min_sec.split(':')
+    return int(minutes) * 60 + int(seconds)
+
+
+def period_starts(momentum_json: dict) -> list[tuple[int, datetime]]:
+    """Momentum 응답의 matchDetails에서 (period, 시작 시각) 목록 추출"""
+    periods = momentum_json.get('liveData', {}).get('matchDetails', {}).get('period', [])
+    return sorted((period['id'], parse_utc(period['start'])) for period in periods if period.get('start'))
+
+
+def wall_clock_to_match_clock(timestamp: datetime, starts: list[tuple[int, datetime]]) -> tuple[int, int]:
+    """
+    실제 시각을 (period, 경기 시계 초)로 변환
+
+    Args:
+        timestamp: UTC 시각
+        starts: period_starts() 결과
+
+    Returns:
+        (period, 경기 시계 초), 첫 period 시작 전이면 (PERIOD_PRE_MATCH, 킥오프까지 남은 초의 음수)
+    """
+    if not starts or timestamp < starts[0][1]:
+        kickoff = starts[0][1] if starts else timestamp
+        return PERIOD_PRE_MATCH, int((timestamp - kickoff).total_seconds())
+
+    period_id, start = next((p, s) for p, s in reversed(starts) if s <= timestamp)
+    elapsed = int((timestamp - start).total_seconds())
+    return period_id, PERIOD_START_MINUTE.get(period_id, 0) * 60 + elapsed
+
+
+def _event(period_id: int, clock_sec: int, minute: str, source: str, event_type: str, **fields) -> TimelineEvent:
+    """기본값을 채운 타임라인 이벤트 생성"""
+    event: TimelineEvent = {
+        'period_ID': period_id,
+        'clock_sec': clock_sec,
+        'minute': minute,
+        'source': source,
+        'event_type': event_type,
+        'team_ID': None,
+        'player_ID': None,
+        'related_player_ID': None,
+        'home_value': None,
+        'away_value': None,
+        'detail': None,
+    }
+    event.update(fields)
+    return event
+
+
+def _id(value: Optional[str | int]) -> Optional[int]:
+    """문자열 ID를 정수로 변환 (없으면 None)"""
+    return int(value) if value else None
+
+
+# ==================== 소스별 제너레이터 ====================
+def iter_lineup_events(lineups_json: dict, dims: dict[str, DimensionTable]) -> Iterator[TimelineEvent]:
+    """Lineups 응답의 선발 / 벤치 선수 (킥오프 시점)"""
+    for side in ('home_team', 'away_team'):
+        team_lineup = lineups_json.get(side, {})
+        team_id = int(team_lineup['teamId'])
+        intern_team(dims, team_id)
+
+        formation = team_lineup.get('formation', {})
+        starters = {player_id for line in formation.get('lineup', []) for player_id in line}
+
+        for player in team_lineup.get('players', []):
+            player_id = int(player['id'])
+            intern_player(dims, player_id, first_name=player.get('firstName'), last_name=player.get('lastName'))
+            yield _event(
+                PERIOD_PRE_MATCH, 0, '', SOURCE_LINEUPS,
+                EVENT_STARTER if player['id'] in starters else EVENT_BENCH,
+                team_ID=team_id, player_ID=player_id, detail=player.get('position'),
+            )
+
+
+def iter_goal_events(live_data: dict, dims: dict[str, DimensionTable]) -> Iterator[TimelineEvent]:
+    """Momentum 응답의 득점 (timeMinSec 순)"""
+    for goal in live_data.get('goal', []):
+        player_id = _id(goal.get('opScorerId'))
+        if player_id is not None:
+            intern_player(dims, player_id, match_name=goal.get('scorerName'))
+        yield _event(
+            goal['periodId'], parse_clock(goal['timeMinSec']), goal['timeMinSec'], SOURCE_GOAL, goal.get('type'),
+            team_ID=_id(goal.get('opContestantId')), player_ID=player_id,
+            related_player_ID=_id(goal.get('opAssistPlayerId')),
+            detail=f"{goal.get('homeScore')}-{goal.get('awayScore')}",
+        )
+
+
+def iter_card_events(live_data: dict, dims: dict[str, DimensionTable]) -> Iterator[TimelineEvent]:
+    """Momentum 응답의 카드 (timeMinSec 순)"""
+    for card in live_data.get('card', []):
+        player_id = _id(card.get('opPlayerId'))
+        if player_id is not None:
+            intern_player(dims, player_id, match_name=card.get('playerName'))
+        yield _event(
+            card['periodId'], parse_clock(card['timeMinSec']), card['timeMinSec'], SOURCE_CARD, card.get('type'),
+            team_ID=_id(card.get('opContestantId')), player_ID=player_id, detail=card.get('cardReason'),
+        )
+
+
+def iter_substitute_events(live_data: dict, dims: dict[str, DimensionTable]) -> Iterator[TimelineEvent]:
+    """Momentum 응답의 교체 (timeMinSec 순)"""
+    for sub in live_data.get('substitute', []):
+        player_on, player_off = _id(sub.get('opPlayerOnId')), _id(sub.get('opPlayerOffId'))
+        if player_on is not None:
+            intern_player(dims, player_on, match_name=sub.get('playerOnName'))
+        if player_off is not None:
+            intern_player(dims, player_off, match_name=sub.get('playerOffName'))
+        yield _event(
+            sub['periodId'], parse_clock(sub['timeMinSec']), sub['timeMinSec'], SOURCE_SUBSTITUTE, EVENT_SUBSTITUTE,
+            team_ID=_id(sub.get('opContestantId')), player_ID=player_on,
+            related_player_ID=player_off, detail=sub.get('subReason'),
+        )
+
+
+def iter_momentum_events(live_data: dict) -> Iterator[TimelineEvent]:
+    """
+    Momentum 응답의 분 단위 예측값
+
+    API는 최신 분부터 내려주므로 뒤에서부터 읽어 시간 순으로 반환하며,
+    timeMin 분의 값은 해당 분이 끝나는 시점(timeMin * 60초)에 배치합니다.
+    """
+    for prediction in reversed(live_data.get('predictions', [])):
+        values = {item['type']: float(item['probability']) for item in prediction.get('prediction', [])}
+        yield _event(
+            prediction['periodId'], prediction['timeMin'] * 60 + prediction.get('timeMinSec', 0),
+            f"{prediction['timeMin']}'", SOURCE_MOMENTUM, EVENT_MOMENTUM,
+            home_value=values.get('Home'), away_value=values.get('Away'),
+        )
+
+
+def iter_commentary_events(
+    events: Iterable[dict],
+    starts: list[tuple[int, datetime]],
+    dims: dict[str, DimensionTable]
+) -> Iterator[TimelineEvent]:
+    """Commentary 이벤트 (timestamp 순)를 경기 시계로 변환"""
+    for entry in events:
+        period_id, clock_sec = wall_clock_to_match_clock(parse_utc(entry['timestamp']), starts)
+        player_id, related_id = _id(entry.get('player1')), _id(entry.get('player2'))
+        for value in (player_id, related_id):
+            if value is not None:
+                intern_player(dims, value)
+        yield _event(
+            period_id, clock_sec, (entry.get('time') or '').strip(), SOURCE_COMMENTARY, entry.get('type'),
+            team_ID=_id(entry.get('team1')), player_ID=player_id,
+            related_player_ID=related_id, detail=entry.get('comment'),
+        )
+
+
+# ==================== 병합 ====================
+def merge_match_timeline(
+    momentum_json: dict,
+    dims: dict[str, DimensionTable],
+    lineups_json: Optional[dict] = None,
+    commentary_events: Optional[Iterable[dict]] = None
+) -> Iterator[TimelineEvent]:
+    """
+    경기 하나의 소스별 정렬된 스트림을 (period, 경기 시계) 기준으로 k-way 병합
+
+    같은 시점의 이벤트는 소스 순서(라인업 → 득점 → 카드 → 교체 → momentum → 중계)를 유지합니다.
+
+    Args:
+        momentum_json: /v1/matches/{id}/momentum 응답 JSON 데이터
+        dims: 팀 / 선수 ID를 등록할 차원 저장소
+        lineups_json: /v3/matches/{id}/lineups 응답 JSON 데이터
+        commentary_events: commentary 이벤트 목록 (timestamp 오름차순)
+
+    Returns:
+        시간 순 TimelineEvent 제너레이터
+    """
+    live_data = momentum_json.get('liveData', {})
+    for contestant in momentum_json.get('matchInfo', {}).get('contestant', []):
+        intern_team(
+            dims, contestant['opId'],
+            name=contestant.get('name'), short_name=contestant.get('shortName'), code=contestant.get('code')
+        )
+
+    sources: list[Iterator[TimelineEvent]] = []
+    if lineups_json:
+        sources.append(iter_lineup_events(lineups_json, dims))
+    sources.extend([
+        iter_goal_events(live_data, dims),
+        iter_card_events(live_data, dims),
+        iter_substitute_events(live_data, dims),
+        iter_momentum_events(live_data),
+    ])
+    if commentary_events is not None:
+        sources.append(iter_commentary_events(commentary_events, period_starts(momentum_json), dims))
+
+    return heapq.merge(*sources, key=lambda event: (event['period_ID'], event['clock_sec']))
+
+
+# ==================== 저장 ====================
+def open_timeline_store(db_path: Path = TIMELINE_PATH) -> sqlite3.Connection:
+    """타임라인 DB 연결 (없으면 스키마 생성)"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def write_match_timeline(conn: sqlite3.Connection, match_id: int, events: Iterable[TimelineEvent]) -> int:
+    """
+    경기 타임라인을 한 트랜잭션으로 교체 기록 (스트림을 한 행씩 소비)
+
+    Args:
+        conn: 타임라인 DB 연결
+        match_id: 경기 ID
+        events: merge_match_timeline() 결과
+
+    Returns:
+        기록된 이벤트 수
+    """
+    rows = (
+        (match_id, seq, e['period_ID'], e['clock_sec'], e['minute'], e['source'], e['event_type'],
+         e['team_ID'], e['player_ID'], e['related_player_ID'], e['home_value'], e['away_value'], e['detail'])
+        for seq, e in enumerate(events)
+    )
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("DELETE FROM timeline WHERE match_id = ?", (match_id,))
+        cursor = conn.executemany("INSERT INTO timeline VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    return cursor.rowcount
+
+
+def write_dimensions(conn: sqlite3.Connection, dims: dict[str, DimensionTable]) -> None:
+    """정규화된 팀 / 선수 정보 저장 (기존 값은 비어 있지 않은 새 값으로만 갱신)"""
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany(
+        """
+        INSERT INTO teams (id, name, short_name, code) VALUES (?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            name = COALESCE(excluded.name, name),
+            short_name = COALESCE(excluded.short_name, short_name),
+            code = COALESCE(excluded.code, code)
+        """,
+        [(row['ID'], row['name'], row['short_name'], row['code']) for row in dims[TEAMS_DIM].rows]
+    )
+    conn.executemany(
+        """
+        INSERT INTO players (id, first_name, last_name, match_name) VALUES (?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            first_name = COALESCE(excluded.first_name, first_name),
+            last_name = COALESCE(excluded.last_name, last_name),
+            match_name = COALESCE(excluded.match_name, match_name)
+        """,
+        [(row['ID'], row['first_name'], row['last_name'], row['match_name']) for row in dims[PLAYERS_DIM].rows]
+    )
+    conn.execute("COMMIT")
+
+
+def match_result_key(match_id: str, resource: str) -> str:
+    """작업 큐에 커밋된 경기 단위 응답의 작업 키"""
+    return make_job(JOB_MATCH, 0, match_id=match_id, resource=resource)['job_key']
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    작업 큐에 커밋된 경기 단위 응답으로 타임라인 생성 (work_queue.py 수집 후 호출)
+
+    Process:
+        1. momentum 결과가 있는 경기 목록 조회
+        2. 경기마다 momentum / lineups / commentary 스트림 병합 및 기록
+        3. 팀 / 선수 정보 저장
+    """
+    parser = argparse.ArgumentParser(description="Premier League 경기 이벤트 타임라인")
+    parser.add_argument('--queue', type=Path, default=QUEUE_PATH, help="작업 큐 DB 경로")
+    parser.add_argument('--db', type=Path, default=TIMELINE_PATH, help="타임라인 DB 경로")
+    args = parser.parse_args()
+
+    queue_conn = open_queue(args.queue)
+    momentum_prefix = match_result_key('', 'momentum')
+    match_ids = [
+        row['job_key'][len(momentum_prefix):]
+        for row in queue_conn.execute(
+            "SELECT job_key FROM results WHERE job_key LIKE ? ORDER BY job_key", (f"{momentum_prefix}%",)
+        )
+    ]
+
+    conn = open_timeline_store(args.db)
+    dims = create_dimension_store()
+    total = 0
+
+    for match_id in track(match_ids, description="         타임라인"):
+        momentum_json = load_result(queue_conn, match_result_key(match_id, 'momentum'))
+        lineups_json = load_result(queue_conn, match_result_key(match_id, 'lineups'))
+        commentary_json = load_result(queue_conn, match_result_key(match_id, 'commentary'))
+
+        events = merge_match_timeline(
+            momentum_json, dims, lineups_json,
+            commentary_json.get('data', []) if commentary_json else None
+        )
+        total += write_match_timeline(conn, int(match_id), events)
+
+    write_dimensions(conn, dims)
+    console.print(f"\n[green]✓ 저장 완료:[/green] {args.db} ({len(match_ids)}경기 / {total}개 이벤트)")
+
+    conn.close()
+    queue_conn.close()
+
+
+if __name__ == "__main__":
+    main()
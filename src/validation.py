@@ -0,0 +1,255 @@
+"""
+프리미어리그 누적 순위표 정합성 검사
+
+overall / home / away 통계 전체를 DataFrame 단위로 한 번에 검사하여
+API가 잘못 내려준 라운드를 찾아내고, 필요하면 가장 이른 위반 라운드부터
+마지막 수집 라운드까지 다시 수집합니다. home / away 행은 이전 라운드 대비
+played 증가 여부로 저장되므로 이후 라운드도 함께 다시 추출해야 합니다.
+
+검사 항목:
+    - won + drawn + lost == played
+    - points == 3 * won + drawn
+    - home + away == overall (라운드 종료 시점 누적 기준)
+    - 팀별 누적 카운터가 라운드가 지나며 감소하지 않음
+    - 라운드별 position 중복 없음
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+import requests
+from rich.table import Table
+
+from main import (
+    AWAY_STATS,
+    HEADERS,
+    HOME_STATS,
+    OVERALL_STATS,
+    TEAMS,
+    StatsData,
+    TeamPlayedInfo,
+    console,
+    extract_standings_data,
+    fetch_standings_data,
+    save_to_excel,
+)
+
+# ==================== 상수 정의 ====================
+DATA_PATH = Path('data/premier_league_table_2024-25.xlsx')
+
+# 누적 카운터 컬럼
+COUNTER_COLUMNS = ['goals_for', 'goals_against', 'won', 'drawn', 'lost', 'played', 'points']
+
+# 위반 리포트 컬럼
+VIOLATION_COLUMNS = ['sheet', 'check', 'round', 'ID']
+
+# 검사 이름
+CHECK_RESULT_SUM = 'won+drawn+lost==played'
+CHECK_POINTS = 'points==3*won+drawn'
+CHECK_HOME_AWAY = 'home+away==overall'
+CHECK_MONOTONIC = 'monotonic'
+CHECK_POSITION = 'unique_position'
+
+
+# ==================== 검사 함수 ====================
+def _violations(df: pd.DataFrame, mask: pd.Series, sheet: str, check: str) -> pd.DataFrame:
+    """마스크에 해당하는 (round, ID) 행을 위반 리포트 형식으로 변환"""
+    rows = df.loc[mask, ['round', 'ID']]
+    return rows.assign(sheet=sheet, check=check)[VIOLATION_COLUMNS]
+
+
+def check_row_identities(df: pd.DataFrame, sheet: str) -> list[pd.DataFrame]:
+    """승/무/패 합계와 승점 계산식 검사"""
+    result_sum = df['won'] + df['drawn'] + df['lost'] != df['played']
+    points = 3 * df['won'] + df['drawn'] != df['points']
+    return [
+        _violations(df, result_sum, sheet, CHECK_RESULT_SUM),
+        _violations(df, points, sheet, CHECK_POINTS),
+    ]
+
+
+def check_monotonic(df: pd.DataFrame, sheet: str) -> pd.DataFrame:
+    """
+    팀별 누적 카운터가 이전 라운드보다 감소한 행 쌍 검사
+
+    어느 쪽 라운드가 잘못됐는지(이전 라운드가 부풀려졌는지, 현재 라운드가 줄었는지)는
+    알 수 없으므로 감소한 쌍의 이전 행과 현재 행을 모두 보고합니다.
+    """
+    ordered = df.sort_values(['ID', 'round'])
+    decreased = ordered.groupby('ID')[COUNTER_COLUMNS].diff().lt(0).any(axis=1)
+    previous = decreased.groupby(ordered['ID']).shift(-1, fill_value=False).astype(bool)
+    return _violations(ordered, decreased | previous, sheet, CHECK_MONOTONIC)
+
+
+def check_unique_position(df: pd.DataFrame, sheet: str) -> pd.DataFrame:
+    """같은 라운드에서 position이 겹치는 행 검사"""
+    duplicated = df.duplicated(['round', 'position'], keep=False)
+    return _violations(df, duplicated, sheet, CHECK_POSITION)
+
+
+def check_home_away_sum(overall: pd.DataFrame, home: pd.DataFrame, away: pd.DataFrame) -> pd.DataFrame:
+    """
+    라운드 종료 시점 홈 누적 + 원정 누적 == 전체 누적 검사
+
+    home / away 시트는 해당 장소에서 경기한 라운드에만 행이 있으므로
+    각 (round, ID)에 대해 그 라운드 이하의 마지막 홈/원정 행을 맞춰 비교합니다.
+    """
+    base = overall[['round', 'ID'] + COUNTER_COLUMNS].sort_values('round')
+    combined = base[['round', 'ID']].copy()
+
+    for side, df in (('home', home), ('away', away)):
+        side_df = df[['round', 'ID'] + COUNTER_COLUMNS].sort_values('round')
+        side_df = side_df.astype({'round': base['round'].dtype, 'ID': base['ID'].dtype})
+        merged = pd.merge_asof(base[['round', 'ID']], side_df, on='round', by='ID', direction='backward')
+        combined[[f"{side}_{c}" for c in COUNTER_COLUMNS]] = merged[COUNTER_COLUMNS].fillna(0).to_numpy()
+
+    home_values = combined[[f"home_{c}" for c in COUNTER_COLUMNS]].to_numpy()
+    away_values = combined[[f"away_{c}" for c in COUNTER_COLUMNS]].to_numpy()
+    mismatch = (home_values + away_values != base[COUNTER_COLUMNS].to_numpy()).any(axis=1)
+
+    return _violations(base, pd.Series(mismatch, index=base.index), OVERALL_STATS, CHECK_HOME_AWAY)
+
+
+def validate_standings(data_store: dict[str, list[StatsData] | pd.DataFrame]) -> pd.DataFrame:
+    """
+    전체 통계에 대해 모든 정합성 검사 실행
+
+    Args:
+        data_store: overall_stats / home_stats / away_stats 레코드 리스트 또는 DataFrame
+
+    Returns:
+        위반 행 DataFrame (sheet, check, round, ID), 위반이 없으면 빈 DataFrame
+    """
+    frames = {key: pd.DataFrame(data_store[key]) for key in (OVERALL_STATS, HOME_STATS, AWAY_STATS)}
+    if frames[OVERALL_STATS].empty:
+        return pd.DataFrame(columns=VIOLATION_COLUMNS)
+
+    reports: list[pd.DataFrame] = []
+    for sheet, df in frames.items():
+        if df.empty:
+            continue
+        reports.extend(check_row_identities(df, sheet))
+        reports.append(check_monotonic(df, sheet))
+
+    reports.append(check_unique_position(frames[OVERALL_STATS], OVERALL_STATS))
+    reports.append(check_home_away_sum(frames[OVERALL_STATS], frames[HOME_STATS], frames[AWAY_STATS]))
+
+    violations = pd.concat(reports, ignore_index=True)
+    return violations.sort_values(['round', 'ID', 'sheet', 'check']).reset_index(drop=True)
+
+
+# ==================== 재수집 ====================
+def build_played_tracker(data_store: dict[str, list], before_round: int) -> dict[int, TeamPlayedInfo]:
+    """지정 라운드 이전까지의 home/away 레코드로 팀별 played 추적 정보 재구성"""
+    tracker: dict[int, TeamPlayedInfo] = {}
+
+    for key, played_key in ((HOME_STATS, 'home_played'), (AWAY_STATS, 'away_played')):
+        for row in data_store[key]:
+            if row['round'] >= before_round:
+                continue
+            info = tracker.setdefault(row['ID'], {'home_played': 0, 'away_played': 0})
+            info[played_key] = max(info[played_key], row['played'])
+
+    return tracker
+
+
+def refetch_rounds(session: requests.Session, data_store: dict[str, list], from_round: int) -> int:
+    """
+    위반 라운드부터 마지막 수집 라운드까지 다시 수집하여 레코드 교체
+
+    home / away 행은 직전 라운드 대비 played가 증가한 경우에만 저장되므로 잘못된
+    라운드 R을 고치면 R 이후 라운드의 저장 여부도 달라집니다. 따라서 R 이전 레코드로
+    played 추적 정보를 재구성한 뒤 R부터 마지막 라운드까지 모두 다시 추출합니다.
+    한 라운드라도 수집에 실패하면 부분 교체로 시트가 어긋나지 않도록 아무것도 바꾸지 않습니다.
+
+    Args:
+        session: HTTP 요청에 사용할 requests.Session 객체
+        data_store: 교체할 데이터 저장소 (레코드 리스트)
+        from_round: 다시 수집을 시작할 라운드 (가장 이른 위반 라운드)
+
+    Returns:
+        다시 추출한 라운드 수 (수집 실패 시 0)
+    """
+    last_round = max(row['round'] for row in data_store[OVERALL_STATS])
+    rounds = range(from_round, last_round + 1)
+
+    fetched: dict[int, dict] = {}
+    for round_num in rounds:
+        standings_json = fetch_standings_data(session, round_num)
+        if standings_json is None:
+            console.print(f"[yellow][Round {round_num}] 재수집 실패, 기존 데이터를 유지합니다[/yellow]")
+            return 0
+        fetched[round_num] = standings_json
+
+    for key in (OVERALL_STATS, HOME_STATS, AWAY_STATS):
+        data_store[key] = [row for row in data_store[key] if row['round'] < from_round]
+
+    tracker = build_played_tracker(data_store, from_round)
+    for round_num in rounds:
+        extract_standings_data(fetched[round_num], round_num, data_store, tracker)
+
+    return len(rounds)
+
+
+# ==================== 결과 출력 ====================
+def print_violations(violations: pd.DataFrame) -> None:
+    """위반 행을 검사 항목별 요약과 함께 출력"""
+    if violations.empty:
+        console.print("[green]✓ 정합성 검사 통과[/green]")
+        return
+
+    table = Table(title=f"정합성 위반 {len(violations)}건")
+    for column in VIOLATION_COLUMNS:
+        table.add_column(column)
+    for row in violations.itertuples(index=False):
+        table.add_row(row.sheet, row.check, str(row.round), str(row.ID))
+    console.print(table)
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    엑셀 파일의 정합성 검사 실행
+
+    Process:
+        1. 엑셀 파일 로드 및 검사
+        2. (--refetch) 가장 이른 위반 라운드부터 마지막 라운드까지 재수집 후 재검사
+        3. (--refetch) 재검사 결과가 나빠지지 않은 경우에만 엑셀 파일 다시 저장
+    """
+    parser = argparse.ArgumentParser(description="Premier League 순위표 정합성 검사")
+    parser.add_argument('--path', type=Path, default=DATA_PATH)
+    parser.add_argument('--refetch', action='store_true', help="위반 라운드부터 다시 수집하여 교체")
+    args = parser.parse_args()
+
+    sheets = pd.read_excel(args.path, sheet_name=None)
+    data_store: dict[str, list] = {key: df.to_dict('records') for key, df in sheets.items()}
+
+    violations = validate_standings(data_store)
+    print_violations(violations)
+
+    if violations.empty or not args.refetch:
+        return
+
+    from_round = int(violations['round'].min())
+    console.print(f"\n[cyan]Round {from_round}부터 재수집 중...[/cyan]")
+
+    with requests.Session() as session:
+        session.headers.update(HEADERS)
+        refetched = refetch_rounds(session, data_store, from_round)
+
+    if not refetched:
+        return
+
+    revalidated = validate_standings(data_store)
+    print_violations(revalidated)
+    if len(revalidated) > len(violations):
+        console.print("[yellow]⚠ 재수집 후 위반이 늘어 엑셀 파일을 덮어쓰지 않습니다.[/yellow]")
+        return
+
+    data_store.setdefault(TEAMS, [])
+    save_to_excel(data_store, args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,658 @@
+"""
+프리미어리그 데이터 수집 작업 큐 (SQLite 기반)
+
+팀 / 라운드별 순위표 / 라운드별 경기 / 경기 단위 API 요청을 작업 레코드로 저장하고,
+한 호스트의 여러 워커 프로세스가 리스(lease)와 하트비트로 작업을 나눠 처리합니다.
+
+큐 파일은 WAL 모드를 사용하므로 로컬 디스크에 두고 한 호스트에서만 열어야 합니다
+(WAL은 공유 메모리를 사용하므로 네트워크 파일시스템에서는 큐가 손상될 수 있음).
+처음 연 호스트를 큐에 기록하고 다른 호스트에서 열면 거부합니다.
+
+요청 예산은 작업 단위가 아니라 HTTP 요청 단위로 차감되므로 commentary 페이지
+요청과 fetch_with_retry의 재시도도 모두 예산에 포함됩니다.
+
+수집된 원본 응답은 작업 키 기준으로 한 번만 커밋되며(멱등),
+export 단계에서 기존 extract 함수로 시즌별 엑셀 파일을 생성합니다.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, TypedDict
+
+import requests
+from rich.progress import track
+
+from main import (
+    AWAY_STATS,
+    END_ROUND,
+    HEADERS,
+    HOME_STATS,
+    MATCH_RESOURCE_URLS,
+    OVERALL_STATS,
+    PERIOD_FULL_TIME,
+    SEASON_ID,
+    START_ROUND,
+    TEAMS,
+    TeamPlayedInfo,
+    console,
+    extract_standings_data,
+    extract_teams_data,
+    fetch_commentary_events,
+    fetch_match_resource,
+    fetch_matches_data,
+    fetch_standings_data,
+    fetch_teams_data,
+    save_to_excel,
+)
+
+# ==================== 타입 정의 ====================
+class JobData(TypedDict):
+    """작업 레코드 구조"""
+    job_key: str
+    kind: str
+    season: int
+    round: Optional[int]
+    match_ID: Optional[str]
+    resource: Optional[str]  # match: 리소스명 / matches: 파생시킬 리소스 목록(콤마 구분)
+    attempts: int
+
+
+# ==================== 상수 정의 ====================
+# 큐 설정
+QUEUE_PATH = Path('data/queue.sqlite3')
+LEASE_SECONDS = 60
+HEARTBEAT_INTERVAL = LEASE_SECONDS / 3
+MAX_JOB_ATTEMPTS = 5
+POLL_INTERVAL = 2
+SQLITE_TIMEOUT = 30
+
+# 요청 속도 제한 (토큰 버킷)
+RATE_PER_SECOND = 2.0
+RATE_BURST = 5.0
+RATE_SCOPE_GLOBAL = 'global'  # 큐의 모든 워커가 하나의 예산 공유
+RATE_SCOPE_HOST = 'host'      # 호스트 이름별 예산
+RATE_SCOPES = [RATE_SCOPE_GLOBAL, RATE_SCOPE_HOST]
+
+# 작업 종류 (우선순위: 숫자가 작을수록 먼저 처리)
+JOB_TEAMS = 'teams'
+JOB_STANDINGS = 'standings'
+JOB_MATCHES = 'matches'
+JOB_MATCH = 'match'
+JOB_PRIORITY = {JOB_TEAMS: 0, JOB_STANDINGS: 1, JOB_MATCHES: 1, JOB_MATCH: 2}
+
+# 작업 상태
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    round INTEGER,
+    match_id TEXT,
+    resource TEXT,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_lease_idx ON jobs (status, priority, lease_expires);
+
+CREATE TABLE IF NOT EXISTS results (
+    job_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    committed_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS queue_owner (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    host TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rate_budget (
+    scope TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+# ==================== 큐 저장소 ====================
+def open_queue(db_path: Path) -> sqlite3.Connection:
+    """
+    작업 큐 DB 연결 (없으면 스키마 생성)
+
+    Args:
+        db_path: SQLite 파일 경로
+
+    Returns:
+        autocommit 모드의 sqlite3 연결 (트랜잭션은 BEGIN IMMEDIATE로 직접 관리)
+
+    Raises:
+        RuntimeError: 다른 호스트에서 만든 큐 파일인 경우
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+
+    host = socket.gethostname()
+    conn.execute("INSERT OR IGNORE INTO queue_owner (id, host) VALUES (1, ?)", (host,))
+    owner = conn.execute("SELECT host FROM queue_owner WHERE id = 1").fetchone()['host']
+    if owner != host:
+        conn.close()
+        raise RuntimeError(f"{db_path}는 {owner} 호스트의 큐입니다. 큐는 한 호스트에서만 사용할 수 있습니다.")
+
+    return conn
+
+
+def make_job(
+    kind: str,
+    season: int,
+    round_num: Optional[int] = None,
+    match_id: Optional[str] = None,
+    resource: Optional[str] = None
+) -> JobData:
+    """
+    작업 종류별 고유 키를 가진 작업 레코드 생성
+
+    matches 작업은 파생시킬 리소스 목록이 결과의 일부이므로 키에 리소스 목록을 포함합니다.
+    (다른 리소스로 다시 enqueue하면 새 작업이 되어 해당 리소스의 경기 작업이 파생됨)
+    """
+    if kind == JOB_TEAMS:
+        job_key = f"{kind}:{season}"
+    elif kind == JOB_MATCH:
+        job_key = f"{kind}:{resource}:{match_id}"
+    elif kind == JOB_MATCHES:
+        job_key = f"{kind}:{season}:{round_num}:{resource}"
+    else:
+        job_key = f"{kind}:{season}:{round_num}"
+
+    return {
+        'job_key': job_key,
+        'kind': kind,
+        'season': season,
+        'round': round_num,
+        'match_ID': match_id,
+        'resource': resource,
+        'attempts': 0,
+    }
+
+
+def enqueue_jobs(conn: sqlite3.Connection, jobs: list[JobData]) -> int:
+    """
+    작업 등록 (이미 존재하는 작업 키는 무시)
+
+    Returns:
+        새로 등록된 작업 수
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    before = conn.total_changes
+    _insert_jobs(conn, jobs)
+    conn.execute("COMMIT")
+    return conn.total_changes - before
+
+
+def _insert_jobs(conn: sqlite3.Connection, jobs: list[JobData]) -> None:
+    """진행 중인 트랜잭션 안에서 작업 레코드 삽입"""
+    now = time.time()
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO jobs
+            (job_key, kind, season, round, match_id, resource, priority, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (job['job_key'], job['kind'], job['season'], job['round'],
+             job['match_ID'], job['resource'], JOB_PRIORITY[job['kind']], now)
+            for job in jobs
+        ]
+    )
+
+
+def lease_job(conn: sqlite3.Connection, worker_id: str) -> Optional[JobData]:
+    """
+    대기 중이거나 리스가 만료된 작업 하나를 워커에게 할당
+
+    리스가 만료된 작업(워커가 죽은 경우 포함)도 시도 횟수에 포함되며,
+    최대 시도 횟수를 다 쓴 만료 작업은 failed로 처리합니다.
+
+    Args:
+        conn: 큐 DB 연결
+        worker_id: 워커 식별자 (호스트명:PID)
+
+    Returns:
+        할당된 작업, 없으면 None
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute(
+        """
+        UPDATE jobs
+        SET status = ?, lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ?
+        WHERE status = ? AND lease_expires < ? AND attempts >= ?
+        """,
+        (STATUS_FAILED, "리스 만료 (최대 시도 횟수 초과)", now, STATUS_LEASED, now, MAX_JOB_ATTEMPTS)
+    )
+    row = conn.execute(
+        """
+        SELECT * FROM jobs
+        WHERE (status = ? OR (status = ? AND lease_expires < ?)) AND attempts < ?
+        ORDER BY priority, season, round, job_key
+        LIMIT 1
+        """,
+        (STATUS_PENDING, STATUS_LEASED, now, MAX_JOB_ATTEMPTS)
+    ).fetchone()
+
+    if row is None:
+        conn.execute("COMMIT")
+        return None
+
+    conn.execute(
+        """
+        UPDATE jobs
+        SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?
+        WHERE job_key = ?
+        """,
+        (STATUS_LEASED, worker_id, now + LEASE_SECONDS, now, row['job_key'])
+    )
+    conn.execute("COMMIT")
+
+    return {
+        'job_key': row['job_key'],
+        'kind': row['kind'],
+        'season': row['season'],
+        'round': row['round'],
+        'match_ID': row['match_id'],
+        'resource': row['resource'],
+        'attempts': row['attempts'] + 1,
+    }
+
+
+def heartbeat_job(conn: sqlite3.Connection, job_key: str, worker_id: str) -> bool:
+    """
+    작업 리스 연장
+
+    Returns:
+        리스를 계속 보유 중이면 True, 다른 워커에게 넘어갔으면 False
+    """
+    now = time.time()
+    cursor = conn.execute(
+        """
+        UPDATE jobs SET lease_expires = ?, updated_at = ?
+        WHERE job_key = ? AND lease_owner = ? AND status = ?
+        """,
+        (now + LEASE_SECONDS, now, job_key, worker_id, STATUS_LEASED)
+    )
+    return cursor.rowcount == 1
+
+
+def complete_job(
+    conn: sqlite3.Connection,
+    job: JobData,
+    worker_id: str,
+    payload: dict | list,
+    derived_jobs: Optional[list[JobData]] = None
+) -> bool:
+    """
+    작업 결과 커밋 (같은 작업 키의 결과는 한 번만 저장되는 멱등 커밋)
+
+    Args:
+        conn: 큐 DB 연결
+        job: 완료한 작업
+        worker_id: 워커 식별자
+        payload: API 응답 원본
+        derived_jobs: 결과로부터 파생된 후속 작업 (예: 경기 단위 요청)
+
+    Returns:
+        이번 호출에서 결과가 새로 저장되었으면 True
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO results (job_key, payload, worker, committed_at) VALUES (?, ?, ?, ?)",
+        (job['job_key'], json.dumps(payload, ensure_ascii=False), worker_id, now)
+    )
+    inserted = cursor.rowcount == 1
+    conn.execute(
+        "UPDATE jobs SET status = ?, lease_owner = NULL, last_error = NULL, updated_at = ? WHERE job_key = ?",
+        (STATUS_DONE, now, job['job_key'])
+    )
+
+    # 결과와 후속 작업을 같은 트랜잭션으로 커밋
+    if inserted and derived_jobs:
+        _insert_jobs(conn, derived_jobs)
+    conn.execute("COMMIT")
+
+    return inserted
+
+
+def fail_job(conn: sqlite3.Connection, job: JobData, worker_id: str, error: str) -> None:
+    """작업 실패 기록 (최대 시도 횟수 초과 시 failed, 아니면 다시 대기 상태로)"""
+    status = STATUS_FAILED if job['attempts'] >= MAX_JOB_ATTEMPTS else STATUS_PENDING
+    conn.execute(
+        """
+        UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ?
+        WHERE job_key = ? AND lease_owner = ?
+        """,
+        (status, error, time.time(), job['job_key'], worker_id)
+    )
+
+
+def count_jobs(conn: sqlite3.Connection) -> dict[str, int]:
+    """상태별 작업 수 집계"""
+    rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+    return {row['status']: row['n'] for row in rows}
+
+
+def acquire_rate_token(
+    conn: sqlite3.Connection,
+    scope: str,
+    rate: float = RATE_PER_SECOND,
+    burst: float = RATE_BURST
+) -> float:
+    """
+    공유 토큰 버킷에서 요청 1건의 예산을 차감
+
+    Args:
+        conn: 큐 DB 연결
+        scope: rate_budget 키 ('global' 또는 'host:호스트명', rate_scope_key() 참고)
+        rate: 초당 토큰 충전량
+        burst: 버킷 최대 크기
+
+    Returns:
+        0이면 즉시 요청 가능, 양수면 대기해야 할 초
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    row = conn.execute("SELECT tokens, updated_at FROM rate_budget WHERE scope = ?", (scope,)).fetchone()
+    tokens = burst if row is None else min(burst, row['tokens'] + (now - row['updated_at']) * rate)
+
+    wait = 0.0
+    if tokens >= 1:
+        tokens -= 1
+    else:
+        wait = (1 - tokens) / rate
+
+    conn.execute(
+        "INSERT OR REPLACE INTO rate_budget (scope, tokens, updated_at) VALUES (?, ?, ?)",
+        (scope, tokens, now)
+    )
+    conn.execute("COMMIT")
+    return wait
+
+
+def rate_scope_key(scope: str) -> str:
+    """예산 범위를 rate_budget 테이블의 키로 변환"""
+    if scope == RATE_SCOPE_HOST:
+        return f"{RATE_SCOPE_HOST}:{socket.gethostname()}"
+    return RATE_SCOPE_GLOBAL
+
+
+class RateLimitedSession(requests.Session):
+    """모든 HTTP 요청 전에 공유 토큰 버킷에서 예산을 차감하는 세션"""
+
+    def __init__(self, conn: sqlite3.Connection, scope: str, rate: float = RATE_PER_SECOND):
+        super().__init__()
+        self.conn = conn
+        self.scope_key = rate_scope_key(scope)
+        self.rate = rate
+
+    def request(self, *args, **kwargs) -> requests.Response:
+        # 재시도와 페이지 요청도 각각 한 건으로 계산
+        while (wait := acquire_rate_token(self.conn, self.scope_key, self.rate)) > 0:
+            time.sleep(wait)
+        return super().request(*args, **kwargs)
+
+
+# ==================== 작업 생성 ====================
+def build_season_jobs(season_id: int, resources: list[str]) -> list[JobData]:
+    """
+    시즌 하나의 팀 / 순위표 / 경기 목록 작업 생성
+
+    Args:
+        season_id: 시즌 ID (예: 2024)
+        resources: 종료된 경기마다 파생시킬 경기 단위 리소스 목록
+
+    Returns:
+        작업 리스트
+    """
+    # 같은 리소스 집합이면 순서와 관계없이 같은 작업 키가 되도록 정렬
+    resource_set = ','.join(sorted(set(resources)))
+
+    jobs = [make_job(JOB_TEAMS, season_id)]
+    for round_num in range(START_ROUND, END_ROUND + 1):
+        jobs.append(make_job(JOB_STANDINGS, season_id, round_num))
+        if resource_set:
+            jobs.append(make_job(JOB_MATCHES, season_id, round_num, resource=resource_set))
+    return jobs
+
+
+def derive_match_jobs(job: JobData, matches_json: dict) -> list[JobData]:
+    """경기 목록 응답에서 종료된 경기별 리소스 작업 생성"""
+    resources = [r for r in (job['resource'] or '').split(',') if r]
+
+    return [
+        make_job(JOB_MATCH, job['season'], job['round'], match.get('matchId'), resource)
+        for match in matches_json.get('data', [])
+        if match.get('period') == PERIOD_FULL_TIME
+        for resource in resources
+    ]
+
+
+# ==================== 워커 ====================
+def execute_job(session: requests.Session, job: JobData) -> Optional[dict | list]:
+    """작업 종류에 맞는 기존 fetch 함수 호출"""
+    kind = job['kind']
+
+    if kind == JOB_TEAMS:
+        return fetch_teams_data(session, job['season'])
+    if kind == JOB_STANDINGS:
+        return fetch_standings_data(session, job['round'], job['season'])
+    if kind == JOB_MATCHES:
+        return fetch_matches_data(session, job['round'], job['season'])
+    if kind == JOB_MATCH and job['resource'] == 'commentary':
+        # 첫 페이지만 저장하지 않도록 모든 페이지를 모아 하나의 응답으로 저장
+        events = fetch_commentary_events(session, job['match_ID'])
+        return None if events is None else {'data': events}
+    if kind == JOB_MATCH:
+        return fetch_match_resource(session, job['resource'], job['match_ID'])
+
+    raise ValueError(f"알 수 없는 작업 종류: {kind}")
+
+
+def _heartbeat_loop(db_path: Path, job_key: str, worker_id: str, stop: threading.Event) -> None:
+    """작업 처리 중 주기적으로 리스를 연장하는 스레드 본문"""
+    conn = open_queue(db_path)
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            if not heartbeat_job(conn, job_key, worker_id):
+                break
+    finally:
+        conn.close()
+
+
+def run_worker(db_path: Path, rate_scope: str, rate: float = RATE_PER_SECOND) -> int:
+    """
+    큐가 빌 때까지 작업을 리스하여 처리
+
+    Args:
+        db_path: 큐 DB 경로
+        rate_scope: 요청 예산 범위 (RATE_SCOPES)
+        rate: 예산 범위별 초당 요청 수
+
+    Returns:
+        이 워커가 새로 커밋한 결과 수
+    """
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    conn = open_queue(db_path)
+    committed = 0
+
+    with RateLimitedSession(conn, rate_scope, rate) as session:
+        session.headers.update(HEADERS)
+
+        while True:
+            job = lease_job(conn, worker_id)
+
+            if job is None:
+                # 다른 워커가 처리 중인 작업이 남아 있으면 (실패/파생 작업 대비) 대기
+                if count_jobs(conn).get(STATUS_LEASED, 0) == 0:
+                    break
+                time.sleep(POLL_INTERVAL)
+                continue
+
+            stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=_heartbeat_loop, args=(db_path, job['job_key'], worker_id, stop), daemon=True
+            )
+            heartbeat.start()
+
+            try:
+                payload = execute_job(session, job)
+            except Exception as e:
+                payload = None
+                console.print(f"[red][{job['job_key']}] 에러 발생: {e}[/red]")
+            finally:
+                stop.set()
+                heartbeat.join()
+
+            if payload is None:
+                fail_job(conn, job, worker_id, "요청 실패")
+                continue
+
+            derived = derive_match_jobs(job, payload) if job['kind'] == JOB_MATCHES else None
+            committed += complete_job(conn, job, worker_id, payload, derived)
+
+    conn.close()
+    return committed
+
+
+def run_workers(db_path: Path, num_workers: int, rate_scope: str, rate: float = RATE_PER_SECOND) -> int:
+    """
+    워커 프로세스 여러 개를 실행
+
+    Returns:
+        전체 워커가 커밋한 결과 수
+    """
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(run_worker, db_path, rate_scope, rate) for _ in range(num_workers)]
+        return sum(future.result() for future in futures)
+
+
+# ==================== 결과 조립 ====================
+def load_result(conn: sqlite3.Connection, job_key: str) -> Optional[dict | list]:
+    """작업 키에 해당하는 커밋된 결과 조회"""
+    row = conn.execute("SELECT payload FROM results WHERE job_key = ?", (job_key,)).fetchone()
+    return None if row is None else json.loads(row['payload'])
+
+
+def build_season_data_store(conn: sqlite3.Connection, season_id: int) -> dict[str, list]:
+    """
+    커밋된 원본 응답을 기존 extract 함수로 라운드 순서대로 정제
+
+    Args:
+        conn: 큐 DB 연결
+        season_id: 시즌 ID
+
+    Returns:
+        save_to_excel()에 바로 넘길 수 있는 데이터 저장소
+    """
+    data_store: dict[str, list] = {
+        TEAMS: [],
+        OVERALL_STATS: [],
+        HOME_STATS: [],
+        AWAY_STATS: [],
+    }
+    team_played_tracker: dict[int, TeamPlayedInfo] = {}
+
+    teams_json = load_result(conn, make_job(JOB_TEAMS, season_id)['job_key'])
+    if teams_json is not None:
+        data_store[TEAMS] = extract_teams_data(teams_json)
+
+    for round_num in range(START_ROUND, END_ROUND + 1):
+        standings_json = load_result(conn, make_job(JOB_STANDINGS, season_id, round_num)['job_key'])
+        if standings_json is None:
+            console.print(f"[yellow][Round {round_num}] 결과 없음, 건너뜀[/yellow]")
+            continue
+        extract_standings_data(standings_json, round_num, data_store, team_played_tracker)
+
+    return data_store
+
+
+# ==================== 메인 함수 ====================
+def main() -> None:
+    """
+    작업 큐 CLI
+
+    Commands:
+        enqueue: 시즌별 작업 등록
+        work: 워커 프로세스 실행
+        status: 상태별 작업 수 출력
+        export: 시즌별 엑셀 파일 생성
+    """
+    parser = argparse.ArgumentParser(description="Premier League 수집 작업 큐")
+    parser.add_argument('--db', type=Path, default=QUEUE_PATH, help="큐 DB 경로")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    enqueue_parser = subparsers.add_parser('enqueue')
+    enqueue_parser.add_argument('--seasons', type=int, nargs='+', default=[SEASON_ID])
+    enqueue_parser.add_argument(
+        '--resources', nargs='*', default=[], choices=list(MATCH_RESOURCE_URLS),
+        help="종료된 경기마다 수집할 경기 단위 리소스"
+    )
+
+    work_parser = subparsers.add_parser('work')
+    work_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    work_parser.add_argument(
+        '--rate-scope', choices=RATE_SCOPES, default=RATE_SCOPE_GLOBAL,
+        help="요청 예산 범위 (global: 큐 전체 공유, host: 호스트별)"
+    )
+    work_parser.add_argument('--rate', type=float, default=RATE_PER_SECOND, help="예산 범위별 초당 요청 수")
+
+    subparsers.add_parser('status')
+
+    export_parser = subparsers.add_parser('export')
+    export_parser.add_argument('--seasons', type=int, nargs='+', default=[SEASON_ID])
+
+    args = parser.parse_args()
+    conn = open_queue(args.db)
+
+    if args.command == 'enqueue':
+        for season_id in args.seasons:
+            added = enqueue_jobs(conn, build_season_jobs(season_id, args.resources))
+            console.print(f"[green]✓ {season_id}:[/green] {added}개 작업 등록")
+
+    elif args.command == 'work':
+        console.print(f"[cyan]워커 {args.workers}개 실행 중...[/cyan]")
+        committed = run_workers(args.db, args.workers, args.rate_scope, args.rate)
+        console.print(f"[green]✓ 완료:[/green] {committed}개 결과 커밋")
+
+    elif args.command == 'status':
+        for status, count in sorted(count_jobs(conn).items()):
+            console.print(f"  • {status}: [bold]{count}[/bold]개")
+
+    elif args.command == 'export':
+        for season_id in track(args.seasons, description="         내보내기"):
+            output_path = Path(f"data/premier_league_table_{season_id}-{(season_id + 1) % 100:02d}.xlsx")
+            save_to_excel(build_season_data_store(conn, season_id), output_path)
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()